@@ -17,6 +17,7 @@ from .progress_tracker import (
     MatchingProgress,
     ProgressState,
     load_progress,
+    load_progress_mmap,
     watch_progress,
 )
 
@@ -30,6 +31,7 @@ __all__ = [
     'MatchingProgress',
     'ProgressState',
     'load_progress',
+    'load_progress_mmap',
     'watch_progress',
 ]
 
@@ -33,9 +33,15 @@ import time
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Pattern, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse, quote_plus
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,14 +53,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger('playwright_mcp_crawler')
 
+# Currency-prefixed price formats, merged into one alternation so a price
+# string is scanned once instead of once per currency.
+_PRICE_RE = re.compile(
+    r'(?P<inr_sym>\u20b9\s*[\d,]+(?:\.\d{2})?)'   # symbol
+    r'|(?P<rs>Rs\.?\s*[\d,]+(?:\.\d{2})?)'         # Rs. prefix
+    r'|(?P<inr>INR\s*[\d,]+(?:\.\d{2})?)'           # INR prefix
+    r'|(?P<usd>\$\s*[\d,]+(?:\.\d{2})?)'           # $ symbol
+    r'|(?P<eur>\u20ac\s*[\d,]+(?:\.\d{2})?)',      # symbol
+    re.IGNORECASE
+)
+
 
 # =============================================================================
 # Data Models
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Product:
-    """Product data model for crawled products."""
+    """Product data model for crawled products (immutable, slotted)."""
     url: str
     title: str
     brand: str
@@ -95,6 +112,7 @@ class SiteConfig:
 
     # Optional: Custom extraction patterns
     price_regex: str = r'[\d,]+(?:\.\d{2})?'
+    price_pattern: Pattern = field(init=False, repr=False, compare=False)
 
     # Rate limiting (anti-blocking)
     min_delay: float = 1.0
@@ -110,6 +128,10 @@ class SiteConfig:
     # Search queries per category (optional - expands search coverage)
     queries_per_category: Dict[str, List[str]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Compile the custom pattern once per site instead of per price string
+        self.price_pattern = re.compile(self.price_regex, re.IGNORECASE)
+
 
 # =============================================================================
 # Pre-configured Site Configurations
@@ -688,8 +710,12 @@ class ProgressTracker:
         }
 
         try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(progress_data, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(progress_data, indent=2).encode('utf-8')
+            with open(self.progress_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
 
@@ -920,7 +946,7 @@ class ProductCrawler:
                 # Clean and validate data
                 title = self._clean_text(p.get('title', ''))
                 brand = self._clean_text(p.get('brand', ''))
-                price = self._extract_price(p.get('price', ''), site_config.price_regex)
+                price = self._extract_price(p.get('price', ''), site_config.price_pattern)
 
                 # Try to extract brand from title if not found
                 if not brand and title:
@@ -1220,7 +1246,7 @@ class ProductCrawler:
         text = re.sub(r'[\n\r\t]', '', text)
         return text
 
-    def _extract_price(self, text: str, price_regex: str) -> str:
+    def _extract_price(self, text: str, price_pattern: Pattern) -> str:
         """
         Extract price from text.
 
@@ -1228,26 +1254,21 @@ class ProductCrawler:
         - Indian Rupee: Rs.1,299 or Rs. 1299
         - Dollar: $99.99
         - Euro: 99.99
+
+        Currency-prefixed amounts are matched in a single pass; the site's
+        custom pattern is only tried when none is present, so a bare number
+        (e.g. a discount percentage) never wins over a real price.
         """
         if not text:
             return ''
 
-        patterns = [
-            r'[\u20b9]\s*([\d,]+(?:\.\d{2})?)',  # symbol
-            r'Rs\.?\s*([\d,]+(?:\.\d{2})?)',     # Rs. prefix
-            r'INR\s*([\d,]+(?:\.\d{2})?)',       # INR prefix
-            r'\$\s*([\d,]+(?:\.\d{2})?)',        # $ symbol
-            r'\u20ac\s*([\d,]+(?:\.\d{2})?)',    # symbol
-            price_regex                          # Custom pattern
-        ]
+        match = _PRICE_RE.search(text)
+        if match:
+            return match.group(match.lastgroup)
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Return with currency symbol if found
-                if match.group(0).startswith(('₹', '$', '€', 'Rs', 'INR')):
-                    return match.group(0)
-                return match.group(1) if match.lastindex else match.group(0)
+        match = price_pattern.search(text)
+        if match:
+            return match.group(1) if match.lastindex else match.group(0)
 
         return ''
 
@@ -1361,8 +1382,8 @@ def load_progress(progress_file: Path) -> Optional[Dict[str, Any]]:
     """
     try:
         if progress_file.exists():
-            with open(progress_file, 'r') as f:
-                return json.load(f)
+            data = progress_file.read_bytes()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
     except Exception as e:
         logger.error(f"Failed to load progress: {e}")
     return None
@@ -4,6 +4,8 @@ Real-Time Progress Tracking System for URL-to-URL Mapping Crawler
 
 Provides:
 - Real-time progress tracking with JSON state file
+- Append-only NDJSON event log (progress.ndjson) for tailing
+- Optional memory-mapped snapshot (progress.mmap) for zero-copy readers
 - Rich terminal UI with live progress bars
 - HTML dashboard for browser-based monitoring
 - Callback system for event handling
@@ -19,31 +21,396 @@ Usage:
     tracker.complete()
 """
 
+import html
+import importlib.util
 import json
+import mmap
 import os
+import struct
 import time
 import threading
-from datetime import datetime, timedelta
+from collections import deque
 from pathlib import Path
-from typing import Optional, Callable, Dict, List, Any, Union
+from typing import Optional, Callable, Dict, List, Any, Union, Iterator, Deque
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Rich is only imported once a terminal UI is actually created (see _load_rich)
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+if not RICH_AVAILABLE:
+    print("Warning: 'rich' library not installed. Terminal UI will be basic.")
+    print("Install with: pip install rich")
 
 try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str = 'wb', buffering: int = -1):
+    """
+    Open a temp sibling of path for writing and rename it over path on success.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. The temp file is removed if writing fails.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, mode, buffering=buffering) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _load_rich() -> None:
+    """Import the rich components used by the terminal UI into module globals."""
+    global Console, Table, Column, Panel, Progress, TaskID, Live, Layout, Text
+    if 'Console' in globals():
+        return
+
     from rich.console import Console
-    from rich.table import Table
+    from rich.table import Table, Column
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn, TaskID
+    from rich.progress import Progress, TaskID
     from rich.live import Live
     from rich.layout import Layout
     from rich.text import Text
-    from rich.style import Style
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    print("Warning: 'rich' library not installed. Terminal UI will be basic.")
-    print("Install with: pip install rich")
+
+
+# Shared-memory snapshot (progress.mmap): a 16-byte header of
+# (version, length) followed by the JSON payload. The version is odd while
+# a write is in progress, so readers can detect and retry torn reads.
+_MMAP_HEADER = struct.Struct('<QQ')
+_MMAP_SIZE = 256 * 1024
+
+# Static shell of the HTML dashboard; only the body is rebuilt per update
+_DASHBOARD_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta http-equiv="refresh" content="2">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>URL Mapper Progress Dashboard</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+            color: #e0e0e0;
+            min-height: 100vh;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            font-size: 2.5rem;
+            background: linear-gradient(90deg, #00d4ff, #00ff88);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin-bottom: 10px;
+        }
+        .status-badge {
+            display: inline-block;
+            padding: 8px 20px;
+            border-radius: 20px;
+            font-weight: bold;
+            text-transform: uppercase;
+            font-size: 0.9rem;
+        }
+        .status-crawling { background: #f59e0b; color: #000; }
+        .status-matching { background: #06b6d4; color: #000; }
+        .status-completed { background: #10b981; color: #000; }
+        .status-idle { background: #6b7280; }
+        .status-error { background: #ef4444; }
+
+        .grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .card {
+            background: rgba(255, 255, 255, 0.05);
+            border-radius: 16px;
+            padding: 24px;
+            backdrop-filter: blur(10px);
+            border: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        .card h3 {
+            color: #00d4ff;
+            margin-bottom: 16px;
+            font-size: 1.2rem;
+        }
+        .progress-container {
+            background: rgba(0, 0, 0, 0.3);
+            border-radius: 10px;
+            height: 24px;
+            overflow: hidden;
+            margin: 10px 0;
+        }
+        .progress-bar {
+            height: 100%;
+            border-radius: 10px;
+            transition: width 0.3s ease;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-weight: bold;
+            font-size: 0.8rem;
+        }
+        .progress-crawl {
+            background: linear-gradient(90deg, #f59e0b, #fbbf24);
+            color: #000;
+        }
+        .progress-match {
+            background: linear-gradient(90deg, #06b6d4, #22d3ee);
+            color: #000;
+        }
+        .stat {
+            display: flex;
+            justify-content: space-between;
+            padding: 8px 0;
+            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        .stat:last-child {
+            border-bottom: none;
+        }
+        .stat-value {
+            font-weight: bold;
+            color: #00ff88;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        th {
+            color: #00d4ff;
+            font-weight: 600;
+        }
+        .score-high { color: #10b981; }
+        .score-medium { color: #f59e0b; }
+        .score-low { color: #ef4444; }
+
+        .timestamp {
+            text-align: center;
+            color: #6b7280;
+            font-size: 0.85rem;
+            margin-top: 20px;
+        }
+        .pulse {
+            animation: pulse 2s infinite;
+        }
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
+    </style>
+</head>
+<body>
+"""
+
+_DASHBOARD_TAIL = """    </div>
+</body>
+</html>"""
+
+# Dynamic body fragments (str.format templates, filled once per render)
+_DASHBOARD_OPEN_TPL = """    <div class="container">
+        <div class="header">
+            <h1>URL-to-URL Mapper</h1>
+            {badge}
+        </div>
+
+        <div class="grid">
+            <!-- Site Progress Cards -->
+            """
+
+_SITE_CARD_TPL = """
+            <div class="card">
+                <h3>{name_upper}</h3>
+                <div class="progress-container">
+                    <div class="progress-bar progress-crawl" style="width: {progress}%">
+                        {progress:.1f}%
+                    </div>
+                </div>
+                <div class="stat">
+                    <span>Products</span>
+                    <span class="stat-value">{products} / {target}</span>
+                </div>
+                <div class="stat">
+                    <span>Pages</span>
+                    <span class="stat-value">{pages}</span>
+                </div>
+                <div class="stat">
+                    <span>Rate</span>
+                    <span class="stat-value">{rate}/s</span>
+                </div>
+                <div class="stat">
+                    <span>Status</span>
+                    <span class="stat-value">{status}</span>
+                </div>
+            </div>
+            """
+
+_MATCHING_CARD_TPL = """
+
+            <!-- Matching Progress Card -->
+            <div class="card">
+                <h3>MATCHING PROGRESS</h3>
+                <div class="progress-container">
+                    <div class="progress-bar progress-match" style="width: {pct:.1f}%">
+                        {pct:.1f}%
+                    </div>
+                </div>
+                <div class="stat">
+                    <span>Completed</span>
+                    <span class="stat-value">{completed} / {total}</span>
+                </div>
+                <div class="stat">
+                    <span>Rate</span>
+                    <span class="stat-value">{rate:.2f}/s</span>
+                </div>
+                <div class="stat">
+                    <span>ETA</span>
+                    <span class="stat-value">{eta}</span>
+                </div>
+                {current}
+            </div>
+        </div>
+
+        <!-- Recent Matches Table -->
+        """
+
+_CURRENT_STAT_TPL = """<div class="stat">
+                    <span>Current</span>
+                    <span class="stat-value" style="font-size: 0.8rem;">{current}...</span>
+                </div>"""
+
+_RECENT_MATCHES_HEAD = """
+        <div class="card">
+            <h3>RECENT MATCHES</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Source</th>
+                        <th>Target</th>
+                        <th>Score</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    """
+
+_MATCH_ROW_TPL = """
+                    <tr>
+                        <td>{source}</td>
+                        <td>{target}</td>
+                        <td class="{score_class}">{score}</td>
+                    </tr>
+                    """
+
+_RECENT_MATCHES_TAIL = """
+                </tbody>
+            </table>
+        </div>
+        """
+
+_ERRORS_MARKER = """
+
+        <!-- Errors -->
+        """
+
+_ERRORS_HEAD_TPL = """
+        <div class="card" style="border-color: rgba(239, 68, 68, 0.5);">
+            <h3 style="color: #ef4444;">ERRORS ({count})</h3>
+            """
+
+_ERROR_ROW_TPL = "<p style='color: #fca5a5; margin: 8px 0;'>{error}</p>"
+
+_ERRORS_TAIL = """
+        </div>
+        """
+
+_DASHBOARD_CLOSE_TPL = """
+
+        <p class="timestamp">Last updated: {last_update}</p>
+"""
+
+
+class _RWLock:
+    """
+    Minimal reader-writer lock.
+
+    Any number of readers may hold the lock together; a writer waits for
+    active readers to drain and blocks new ones while it holds the lock.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+
+    @contextmanager
+    def reading(self):
+        """Hold the lock in shared mode."""
+        with self._cond:
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def writing(self):
+        """Hold the lock in exclusive mode."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._readers == 0)
+            yield
 
 
 class Status(Enum):
@@ -56,7 +423,55 @@ class Status(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+# Terminal header color per status
+_STATUS_COLORS = {
+    Status.IDLE.value: "white",
+    Status.CRAWLING.value: "yellow",
+    Status.MATCHING.value: "cyan",
+    Status.COMPLETED.value: "green",
+    Status.ERROR.value: "red"
+}
+
+# HTML-escape dynamic dashboard text; the same titles and errors recur on
+# every render, so each distinct value is escaped once
+_escape = lru_cache(maxsize=1024)(html.escape)
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as H:MM:SS (with a day prefix), like str(timedelta)."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    hms = f"{hours}:{minutes:02d}:{secs:02d}"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {hms}"
+    return hms
+
+
+# Error records kept in the state; older ones are dropped but still counted
+_MAX_ERRORS = 100
+
+# Match score tiers (< 0.5, < 0.8, >= 0.8), indexed by _score_tier()
+_SCORE_CLASSES = ("score-low", "score-medium", "score-high")
+_SCORE_STYLES = ("red", "yellow", "green")
+
+
+def _score_tier(score: float) -> int:
+    """Map a match score to its tier index."""
+    return (score >= 0.5) + (score >= 0.8)
+
+
+# Dashboard status badge per status, with a pulse while work is in progress
+_STATUS_BADGE_HTML = {
+    status.value: (
+        f'<span class="status-badge status-{status.value}">{status.value.upper()}</span>\n'
+        + ('            <span class="pulse" style="margin-left: 10px;">Processing...</span>'
+           if status in (Status.CRAWLING, Status.MATCHING) else '            ')
+    )
+    for status in Status
+}
+
+
+@dataclass(slots=True)
 class SiteProgress:
     """Progress data for a single site."""
     name: str
@@ -71,7 +486,7 @@ class SiteProgress:
     last_product: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchingProgress:
     """Progress data for matching phase."""
     completed: int = 0
@@ -86,7 +501,7 @@ class MatchingProgress:
     recent_matches: List[Dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressState:
     """Complete progress state."""
     status: str = Status.IDLE.value
@@ -97,7 +512,8 @@ class ProgressState:
     last_update: Optional[str] = None
     total_products: int = 0
     total_matches: int = 0
-    errors: List[Dict] = field(default_factory=list)
+    errors: Deque[Dict] = field(default_factory=lambda: deque(maxlen=_MAX_ERRORS))
+    errors_count: int = 0
 
 
 class ProgressCallback(ABC):
@@ -118,6 +534,16 @@ class ProgressCallback(ABC):
         """Called when an error occurs."""
         pass
 
+    def on_products_found(self, products: List[Dict]) -> None:
+        """Called with a batch of products; override to handle them in bulk."""
+        for product in products:
+            self.on_product_found(product)
+
+    def on_matches_found(self, matches: List[tuple]) -> None:
+        """Called with a batch of (source, target, score) matches."""
+        for source, target, score in matches:
+            self.on_match_found(source, target, score)
+
 
 class DefaultCallback(ProgressCallback):
     """Default callback implementation that logs events."""
@@ -156,7 +582,9 @@ class ProgressTracker:
         enable_terminal_ui: bool = True,
         enable_html_dashboard: bool = True,
         callback: Optional[ProgressCallback] = None,
-        update_interval: float = 0.5
+        update_interval: float = 0.5,
+        enable_mmap: bool = False,
+        time_func: Callable[[], float] = time.time
     ):
         """
         Initialize the progress tracker.
@@ -168,6 +596,10 @@ class ProgressTracker:
             enable_html_dashboard: Enable HTML dashboard generation
             callback: Custom callback for events
             update_interval: How often to update displays (seconds)
+            enable_mmap: Also publish snapshots to a memory-mapped
+                progress.mmap for lock-free, zero-copy readers
+            time_func: Clock used for elapsed time, rates and ETA
+                (tests can pass a simulated clock)
         """
         self.total_sites = total_sites
         self.output_dir = Path(output_dir)
@@ -177,6 +609,7 @@ class ProgressTracker:
         self.enable_html_dashboard = enable_html_dashboard
         self.callback = callback or DefaultCallback(verbose=False)
         self.update_interval = update_interval
+        self._time = time_func
 
         # State
         self.state = ProgressState()
@@ -189,29 +622,103 @@ class ProgressTracker:
         self._matching_start_time: Optional[float] = None
         self._last_matching_update: Optional[float] = None
 
+        # (second, formatted "YYYY-MM-DDTHH:MM:SS") reused by _now()
+        self._ts_cache: tuple = (0, "")
+
+        # (whole ETA seconds, formatted string) reused by _eta_str()
+        self._eta_cache: tuple = (None, "N/A")
+
         # Recent items for display
-        self._recent_products: List[Dict] = []
-        self._recent_matches: List[Dict] = []
         self._max_recent = 10
+        self._recent_products: deque = deque(maxlen=self._max_recent)
+        self._recent_matches: deque = deque(maxlen=self._max_recent)
+
+        # Product/match callbacks are queued and dispatched in batches by
+        # the background writer, off the update path
+        self._pending_products: deque = deque()
+        self._pending_matches: deque = deque()
+
+        # Last raw (unsliced) titles seen, so repeats skip re-truncation
+        self._last_product_raw: Dict[str, Optional[str]] = {}
+        self._current_raw: Optional[str] = None
+        self._best_match_raw: Optional[str] = None
 
         # Threading for background updates
         self._lock = threading.Lock()
+
+        # Update paths share the RW lock; snapshots take it exclusively just
+        # long enough to copy the state out
+        self._rw_lock = _RWLock()
+
+        # Per-site locks so crawler threads for different sites don't
+        # contend; self._lock guards the shared matching and error state
+        self._site_locks: Dict[str, threading.Lock] = {}
+        self._totals_lock = threading.Lock()
+        self._events_lock = threading.Lock()
+        self._total_products = 0
+
+        # Per-site snapshot dicts, rebuilt only for sites updated since the
+        # last snapshot
+        self._site_cache: Dict[str, Dict] = {}
+        self._dirty_sites: set = set()
+
+        # Background writer: update methods only set the single "dirty" slot
+        # and notify; the writer persists the latest state at most once per
+        # interval, never a backlog
         self._update_thread: Optional[threading.Thread] = None
         self._running = False
+        self._writer_cv = threading.Condition()
+        self._dirty = False
+        self._stop = False
+        self._finalized = False
+        self._last_dashboard_hash: Optional[int] = None
+
+        # The dashboard page reloads every 2s, so regenerating it more often
+        # than that is wasted work; progress.json keeps the faster cadence
+        self._dashboard_interval = 2.0
+        self._next_dashboard_ts = 0.0
+        # Set when a change missed the dashboard because of the interval;
+        # the writer flushes again once the interval has passed
+        self._dashboard_pending = False
+
+        # Terminal redraws are throttled to one per update interval
+        self._next_render_ts = 0.0
 
         # Rich console
         if self.enable_terminal_ui:
+            _load_rich()
             self.console = Console()
             self._live: Optional[Live] = None
+            self._layout: Optional[Layout] = None
             self._progress: Optional[Progress] = None
             self._task_ids: Dict[str, TaskID] = {}
 
         # File paths
         self.progress_file = self.output_dir / "progress.json"
         self.dashboard_file = self.output_dir / "dashboard.html"
+        self.events_file = self.output_dir / "progress.ndjson"
+
+        # Invariant dashboard markup, written around the per-tick body
+        self._html_head = _DASHBOARD_HEAD
+        self._html_tail = _DASHBOARD_TAIL
+
+        # Append-only delta log so monitors can tail events instead of
+        # re-reading the full snapshot
+        self._events_fh = open(self.events_file, 'ab', buffering=1 << 16)
+
+        # Optional memory-mapped snapshot, overwritten in place on each flush
+        self.mmap_file = self.output_dir / "progress.mmap"
+        self._mm: Optional[mmap.mmap] = None
+        self._mm_version = 0
+        self._mm_lock = threading.Lock()
+        if enable_mmap:
+            with open(self.mmap_file, 'a+b') as f:
+                f.truncate(_MMAP_SIZE)
+                self._mm = mmap.mmap(f.fileno(), _MMAP_SIZE)
 
         # Initialize state
         self._init_state()
+        self._start_writer()
 
     def _init_state(self) -> None:
         """Initialize the progress state."""
@@ -220,36 +727,261 @@ class ProgressTracker:
             sites={},
             matching=asdict(MatchingProgress())
         )
-        self._save_state()
+        self._flush_state()
 
     def _now(self) -> str:
         """Get current timestamp as ISO string."""
-        return datetime.now().isoformat()
+        sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            # Only reformat the date/time part once per second
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{us:06d}"
+
+    def _eta_str(self, eta_seconds: Optional[float]) -> str:
+        """Format an ETA, reusing the last string while the whole seconds match."""
+        key = int(eta_seconds) if eta_seconds else None
+        if key != self._eta_cache[0]:
+            self._eta_cache = (key, _format_duration(key) if key is not None else "N/A")
+        return self._eta_cache[1]
+
+    def _flush_state(self, final: bool = False) -> None:
+        """
+        Save current state to JSON file.
+
+        Args:
+            final: Last write of the run: indent the JSON (periodic saves
+                stay compact) and bypass the dashboard rate limit
+        """
+        with self._rw_lock.writing():
+            snapshot = self._snapshot()
+            dashboard_hash = hash((
+                self.state.status,
+                tuple((n, s.products, s.pages, s.status) for n, s in self.sites.items()),
+                self.matching.completed,
+                self.matching.total,
+                self.state.errors_count,
+            ))
+
+        with self._events_lock:
+            if not self._events_fh.closed:
+                self._events_fh.flush()
+
+        # Serialize once and write outside the lock so updates are never
+        # blocked on I/O
+        payload = _dumps(snapshot, pretty=final)
+        try:
+            with _atomic_open(self.progress_file) as f:
+                f.write(payload)
+        except Exception as e:
+            print(f"Warning: Could not save progress file: {e}")
+
+        if self._mm is not None:
+            self._write_mmap(payload)
+
+        # Update HTML dashboard at most once per dashboard interval, and only
+        # when something it shows has changed
+        now = time.monotonic()
+        self._dashboard_pending = False
+        if self.enable_html_dashboard and dashboard_hash != self._last_dashboard_hash:
+            if final or now >= self._next_dashboard_ts:
+                self._next_dashboard_ts = now + self._dashboard_interval
+                if self._generate_html_dashboard(snapshot):
+                    # Only remember the hash once the page is on disk, so a
+                    # failed write is retried on the next flush
+                    self._last_dashboard_hash = dashboard_hash
+            else:
+                self._dashboard_pending = True
+
+    def _snapshot(self) -> Dict:
+        """
+        Build a JSON-ready copy of the state (caller holds the write lock).
+
+        Assembled from direct field reads rather than asdict(), which deep
+        copies every nested dataclass on each call.
+        """
+        # Update state from internal tracking
+        while self._dirty_sites:
+            name = self._dirty_sites.pop()
+            site = self.sites[name]
+            self._site_cache[name] = {
+                "name": site.name,
+                "products": site.products,
+                "target": site.target,
+                "pages": site.pages,
+                "rate": site.rate,
+                "status": site.status,
+                "started_at": site.started_at,
+                "completed_at": site.completed_at,
+                "errors": list(site.errors),
+                "last_product": site.last_product,
+            }
+        self.state.sites = dict(self._site_cache)
+        m = self.matching
+        m.recent_matches = list(self._recent_matches)
+        self.state.matching = {
+            "completed": m.completed,
+            "total": m.total,
+            "source_count": m.source_count,
+            "target_count": m.target_count,
+            "current": m.current,
+            "best_match": m.best_match,
+            "best_score": m.best_score,
+            "eta_seconds": m.eta_seconds,
+            "rate": m.rate,
+            "recent_matches": m.recent_matches,
+        }
+        self.state.last_update = self._now()
+        self.state.total_products = self._total_products
+        self.state.total_matches = m.completed
+
+        state = self.state
+        return {
+            "status": state.status,
+            "started_at": state.started_at,
+            "completed_at": state.completed_at,
+            "sites": state.sites,
+            "matching": state.matching,
+            "last_update": state.last_update,
+            "total_products": state.total_products,
+            "total_matches": state.total_matches,
+            "errors": list(state.errors),
+            "errors_count": state.errors_count,
+        }
+
+    def _append_event(self, event: Dict) -> None:
+        """Append a compact event record to the delta log."""
+        event["t"] = self._now()
+        line = _dumps(event) + b'\n'
+        with self._events_lock:
+            if not self._events_fh.closed:
+                self._events_fh.write(line)
+
+    def _write_mmap(self, payload: bytes) -> None:
+        """Copy a serialized snapshot into the shared mmap."""
+        if len(payload) > _MMAP_SIZE - _MMAP_HEADER.size:
+            return  # Too large for the map; progress.json still has it
+
+        with self._mm_lock:
+            if self._mm is None:
+                return
+            mm = self._mm
+            # Odd version marks the write as in progress
+            self._mm_version += 1
+            _MMAP_HEADER.pack_into(mm, 0, self._mm_version, 0)
+            mm[_MMAP_HEADER.size:_MMAP_HEADER.size + len(payload)] = payload
+            self._mm_version += 1
+            _MMAP_HEADER.pack_into(mm, 0, self._mm_version, len(payload))
+
+    def _close_mmap(self) -> None:
+        """Flush and unmap the shared snapshot."""
+        with self._mm_lock:
+            if self._mm is not None:
+                self._mm.flush()
+                self._mm.close()
+                self._mm = None
+
+    def _add_products(self, delta: int) -> None:
+        """Adjust the running product total across all sites."""
+        if delta:
+            with self._totals_lock:
+                self._total_products += delta
+
+    def _close_events(self) -> None:
+        """Flush and close the delta log."""
+        with self._events_lock:
+            if not self._events_fh.closed:
+                self._events_fh.close()
+
+    def _dispatch_callbacks(self) -> None:
+        """Deliver queued product and match events to the callback in batches."""
+        products = self._drain(self._pending_products)
+        if products:
+            self.callback.on_products_found(products)
+
+        matches = self._drain(self._pending_matches)
+        if matches:
+            self.callback.on_matches_found(matches)
+
+    @staticmethod
+    def _drain(queue: deque) -> List:
+        """Pop everything currently in a deque."""
+        items = []
+        try:
+            while True:
+                items.append(queue.popleft())
+        except IndexError:
+            pass
+        return items
+
+    def _mark_dirty(self) -> None:
+        """Schedule a state save on the background writer."""
+        with self._writer_cv:
+            if self._running:
+                self._dirty = True
+                self._writer_cv.notify()
+                return
+
+        # No writer thread (the tracker has completed)
+        self._dispatch_callbacks()
+        self._flush_state()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._writer_cv:
+            if self._running:
+                return
+            self._running = True
+            self._stop = False
+
+        self._update_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._update_thread.start()
+
+    def _stop_writer(self) -> None:
+        """Stop the background writer thread and wait for it to exit."""
+        with self._writer_cv:
+            if not self._running:
+                return
+            self._running = False
+            self._stop = True
+            self._writer_cv.notify()  # Wake the writer immediately
+
+        if self._update_thread:
+            self._update_thread.join()
+            self._update_thread = None
+
+    def _writer_loop(self) -> None:
+        """Flush dirty state at most once per update interval."""
+        cv = self._writer_cv
+        while True:
+            with cv:
+                while not (self._dirty or self._stop):
+                    if not self._dashboard_pending:
+                        cv.wait()
+                        continue
+                    # Re-flush for the skipped dashboard change once its
+                    # interval is up, even if nothing else changes
+                    delay = self._next_dashboard_ts - time.monotonic()
+                    if delay <= 0:
+                        break
+                    cv.wait(timeout=delay)
+                if self._stop:
+                    break
+                self._dirty = False
 
-    def _save_state(self) -> None:
-        """Save current state to JSON file."""
-        with self._lock:
-            # Update state from internal tracking
-            self.state.sites = {name: asdict(site) for name, site in self.sites.items()}
-            self.state.matching = asdict(self.matching)
-            self.state.last_update = self._now()
-            self.state.total_products = sum(s.products for s in self.sites.values())
-            self.state.total_matches = self.matching.completed
-
-            # Write to file
             try:
-                with open(self.progress_file, 'w') as f:
-                    json.dump(asdict(self.state), f, indent=2, default=str)
+                self._dispatch_callbacks()
             except Exception as e:
-                print(f"Warning: Could not save progress file: {e}")
-
-        # Update HTML dashboard
-        if self.enable_html_dashboard:
-            self._generate_html_dashboard()
+                print(f"Warning: Progress callback failed: {e}")
+            self._flush_state()
+            # Coalesce everything that arrives during the interval into one write
+            with cv:
+                cv.wait_for(lambda: self._stop, timeout=self.update_interval)
 
     def _calculate_rate(self, count: int, start_time: float) -> float:
         """Calculate rate (items per second)."""
-        elapsed = time.time() - start_time
+        elapsed = self._time() - start_time
         return count / elapsed if elapsed > 0 else 0.0
 
     def _calculate_eta(self, completed: int, total: int, rate: float) -> Optional[float]:
@@ -271,21 +1003,29 @@ class ProgressTracker:
             site_name: Name of the site (e.g., "nykaa", "purplle")
             target_products: Target number of products to crawl
         """
-        with self._lock:
+        with self._rw_lock.writing():
+            previous = self.sites.get(site_name)
+            if previous is not None:
+                self._add_products(-previous.products)
+            self._site_locks.setdefault(site_name, threading.Lock())
+            self._site_cache.setdefault(site_name, {})  # Keep site order
+            self._dirty_sites.add(site_name)
+            self._last_product_raw.pop(site_name, None)
             self.sites[site_name] = SiteProgress(
                 name=site_name,
                 target=target_products,
                 status="crawling",
                 started_at=self._now()
             )
-            self._crawl_start_times[site_name] = time.time()
+            self._crawl_start_times[site_name] = self._time()
 
             if self.state.status == Status.IDLE.value:
                 self.state.status = Status.CRAWLING.value
                 self.state.started_at = self._now()
-                self._start_time = time.time()
+                self._start_time = self._time()
 
-        self._save_state()
+        self._start_writer()
+        self._mark_dirty()
 
         if self.enable_terminal_ui:
             self._start_terminal_ui()
@@ -306,13 +1046,19 @@ class ProgressTracker:
             current_page: Current page being crawled
             last_product: Optional dict with info about last product found
         """
-        with self._lock:
-            if site_name not in self.sites:
-                return
+        site = self.sites.get(site_name)
+        if site is None:
+            return
+
+        # Polling crawlers often re-report unchanged counts; nothing to do
+        if last_product is None and products_found == site.products and current_page == site.pages:
+            return
 
-            site = self.sites[site_name]
+        with self._rw_lock.reading(), self._site_locks[site_name]:
+            self._add_products(products_found - site.products)
             site.products = products_found
             site.pages = current_page
+            self._dirty_sites.add(site_name)
 
             # Calculate rate
             if site_name in self._crawl_start_times:
@@ -321,17 +1067,27 @@ class ProgressTracker:
                     self._crawl_start_times[site_name]
                 )
 
+            self._append_event({
+                "event": "crawl",
+                "site": site_name,
+                "products": products_found,
+                "pages": current_page,
+            })
+
             # Track last product
             if last_product:
-                site.last_product = last_product.get('title', str(last_product))[:100]
+                title = last_product.get('title')
+                if title is None:
+                    site.last_product = str(last_product)[:100]
+                elif title != self._last_product_raw.get(site_name):
+                    self._last_product_raw[site_name] = title
+                    site.last_product = title[:100]
                 self._recent_products.append(last_product)
-                if len(self._recent_products) > self._max_recent:
-                    self._recent_products.pop(0)
 
-                # Trigger callback
-                self.callback.on_product_found(last_product)
+        if last_product:
+            self._pending_products.append(last_product)
 
-        self._save_state()
+        self._mark_dirty()
         self._update_terminal_ui()
 
     def complete_crawl(self, site_name: str, final_count: Optional[int] = None) -> None:
@@ -342,15 +1098,17 @@ class ProgressTracker:
             site_name: Name of the site
             final_count: Optional final product count
         """
-        with self._lock:
-            if site_name in self.sites:
-                site = self.sites[site_name]
+        site = self.sites.get(site_name)
+        if site is not None:
+            with self._rw_lock.reading(), self._site_locks[site_name]:
                 site.status = "completed"
+                self._dirty_sites.add(site_name)
                 site.completed_at = self._now()
                 if final_count is not None:
+                    self._add_products(final_count - site.products)
                     site.products = final_count
 
-        self._save_state()
+        self._mark_dirty()
 
     # =========================================================================
     # Public API - Matching
@@ -364,18 +1122,21 @@ class ProgressTracker:
             source_count: Number of source products
             target_count: Number of target products
         """
-        with self._lock:
+        with self._rw_lock.reading(), self._lock:
             self.matching = MatchingProgress(
                 source_count=source_count,
                 target_count=target_count,
                 total=source_count  # We match each source to targets
             )
-            self._matching_start_time = time.time()
-            self._last_matching_update = time.time()
+            self._matching_start_time = self._time()
+            self._last_matching_update = self._time()
+            self._current_raw = None
+            self._best_match_raw = None
 
             self.state.status = Status.MATCHING.value
 
-        self._save_state()
+        self._start_writer()
+        self._mark_dirty()
         self._update_terminal_ui()
 
     def update_matching(
@@ -398,10 +1159,28 @@ class ProgressTracker:
             source_data: Full source product data
             target_data: Full target product data
         """
-        with self._lock:
+        # Reuse the stored truncations when the raw titles repeat
+        m = self.matching
+        if current_product == self._current_raw:
+            current = m.current
+        else:
+            current = current_product[:100] if current_product else None
+        if best_match == self._best_match_raw:
+            best = m.best_match
+        else:
+            best = best_match[:100] if best_match else None
+
+        # Skip repeated reports of the same position and result
+        if (matched == m.completed and current == m.current
+                and best == m.best_match and score == m.best_score):
+            return
+
+        with self._rw_lock.reading(), self._lock:
             self.matching.completed = matched
-            self.matching.current = current_product[:100] if current_product else None
-            self.matching.best_match = best_match[:100] if best_match else None
+            self.matching.current = current
+            self.matching.best_match = best
+            self._current_raw = current_product
+            self._best_match_raw = best_match
             self.matching.best_score = score
 
             # Calculate rate
@@ -416,6 +1195,12 @@ class ProgressTracker:
                     self.matching.rate
                 )
 
+            self._append_event({
+                "event": "match",
+                "completed": matched,
+                "score": score,
+            })
+
             # Track recent matches
             if best_match and score and score > 0:
                 match_record = {
@@ -425,15 +1210,11 @@ class ProgressTracker:
                     "timestamp": self._now()
                 }
                 self._recent_matches.append(match_record)
-                if len(self._recent_matches) > self._max_recent:
-                    self._recent_matches.pop(0)
-                self.matching.recent_matches = self._recent_matches.copy()
 
-                # Trigger callback
-                if source_data and target_data:
-                    self.callback.on_match_found(source_data, target_data, score)
+        if best_match and score and score > 0 and source_data and target_data:
+            self._pending_matches.append((source_data, target_data, score))
 
-        self._save_state()
+        self._mark_dirty()
         self._update_terminal_ui()
 
     # =========================================================================
@@ -448,22 +1229,27 @@ class ProgressTracker:
             error: Error message
             context: Optional context dictionary
         """
-        with self._lock:
+        self._record_error(error, context)
+        self.callback.on_error(error, context or {})
+        self._mark_dirty()
+
+    def _record_error(self, error: str, context: Optional[Dict]) -> None:
+        """Add an error to the state without scheduling a save."""
+        with self._rw_lock.reading(), self._lock:
             error_record = {
                 "error": error,
                 "context": context or {},
                 "timestamp": self._now()
             }
             self.state.errors.append(error_record)
+            self.state.errors_count += 1
 
             # Also add to site if relevant
             if context and "site" in context:
                 site_name = context["site"]
                 if site_name in self.sites:
                     self.sites[site_name].errors.append(error)
-
-        self.callback.on_error(error, context or {})
-        self._save_state()
+                    self._dirty_sites.add(site_name)
 
     # =========================================================================
     # Public API - Completion
@@ -476,12 +1262,7 @@ class ProgressTracker:
         Returns:
             Final summary statistics
         """
-        with self._lock:
-            self.state.status = Status.COMPLETED.value
-            self.state.completed_at = self._now()
-
-        self._save_state()
-        self._stop_terminal_ui()
+        self._finalize(Status.COMPLETED.value)
 
         # Generate final summary
         summary = self._generate_summary()
@@ -491,21 +1272,56 @@ class ProgressTracker:
 
         return summary
 
+    def _finalize(self, status: str, error: Optional[str] = None,
+                  context: Optional[Dict] = None) -> None:
+        """
+        Stop the writer and persist the final state with a single write.
+
+        Later calls are no-ops, so complete() after a failed run does not
+        overwrite the error status or write the files again.
+
+        Args:
+            status: Final Status value
+            error: Optional error to record before the final write
+            context: Context for the error
+        """
+        if self._finalized:
+            return
+        self._finalized = True
+
+        # Final write happens inline once the writer has exited
+        self._stop_writer()
+        if error is not None:
+            self._record_error(error, context)
+            self.callback.on_error(error, context or {})
+
+        with self._rw_lock.reading(), self._lock:
+            self.state.status = status
+            if status == Status.COMPLETED.value:
+                self.state.completed_at = self._now()
+
+        self._dispatch_callbacks()
+        self._flush_state(final=True)
+        self._close_events()
+        self._close_mmap()
+        self._update_terminal_ui(force=True)
+        self._stop_terminal_ui()
+
     def _generate_summary(self) -> Dict:
         """Generate final summary statistics."""
-        total_elapsed = time.time() - self._start_time if self._start_time else 0
+        total_elapsed = self._time() - self._start_time if self._start_time else 0
 
         return {
             "status": "completed",
             "total_time_seconds": round(total_elapsed, 2),
-            "total_time_formatted": str(timedelta(seconds=int(total_elapsed))),
+            "total_time_formatted": _format_duration(total_elapsed),
             "sites_crawled": len(self.sites),
-            "total_products": sum(s.products for s in self.sites.values()),
+            "total_products": self._total_products,
             "total_matches": self.matching.completed,
             "match_rate": round(
                 self.matching.completed / self.matching.total * 100, 1
             ) if self.matching.total > 0 else 0,
-            "errors_count": len(self.state.errors),
+            "errors_count": self.state.errors_count,
             "site_details": {
                 name: {
                     "products": site.products,
@@ -523,33 +1339,75 @@ class ProgressTracker:
 
     def _start_terminal_ui(self) -> None:
         """Start the rich terminal UI."""
-        if not self.enable_terminal_ui:
+        if not self.enable_terminal_ui or self._live is not None:
             return
 
-        # Will be updated in _update_terminal_ui
-        pass
+        # Named sections are updated in place; Live only repaints what changed
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="header", size=4),
+            Layout(name="sites"),
+            Layout(name="matching"),
+            Layout(name="recent"),
+            Layout(name="errors", size=3),
+        )
+        for section in ("sites", "matching", "recent", "errors"):
+            self._layout[section].visible = False
+
+        # Column definitions are built once; each render copies them empty
+        self._site_columns = [
+            Column("Site", style="cyan"),
+            Column("Products", justify="right"),
+            Column("Target", justify="right"),
+            Column("Pages", justify="right"),
+            Column("Rate", justify="right"),
+            Column("Progress", justify="center"),
+            Column("Status"),
+        ]
+        self._match_columns = [
+            Column("Metric", style="cyan"),
+            Column("Value", justify="right"),
+        ]
+        self._recent_columns = [
+            Column("Source", style="cyan", max_width=30),
+            Column("Target", style="green", max_width=30),
+            Column("Score", justify="right"),
+        ]
+
+        self._live = Live(
+            self._layout,
+            console=self.console,
+            refresh_per_second=1 / max(self.update_interval, 0.05),
+            screen=False
+        )
+        self._live.start()
+
+    def _update_terminal_ui(self, force: bool = False) -> None:
+        """
+        Update the terminal UI display.
 
-    def _update_terminal_ui(self) -> None:
-        """Update the terminal UI display."""
+        Args:
+            force: Render even if the update interval has not elapsed
+        """
         if not self.enable_terminal_ui:
             return
 
-        self.console.clear()
+        now = time.monotonic()
+        if not force and now < self._next_render_ts:
+            return
+        self._next_render_ts = now + self.update_interval
+
+        if self._live is None:
+            self._start_terminal_ui()
         self._render_status_panel()
 
     def _render_status_panel(self) -> None:
-        """Render the current status panel."""
+        """Render the current status into the live layout sections."""
         if not self.enable_terminal_ui:
             return
 
         # Header
-        status_color = {
-            Status.IDLE.value: "white",
-            Status.CRAWLING.value: "yellow",
-            Status.MATCHING.value: "cyan",
-            Status.COMPLETED.value: "green",
-            Status.ERROR.value: "red"
-        }.get(self.state.status, "white")
+        status_color = _STATUS_COLORS.get(self.state.status, "white")
 
         header = Text()
         header.append("URL-to-URL Progress Tracker\n", style="bold blue")
@@ -557,21 +1415,15 @@ class ProgressTracker:
         header.append(f"{self.state.status.upper()}", style=f"bold {status_color}")
 
         if self._start_time:
-            elapsed = time.time() - self._start_time
-            header.append(f"  |  Elapsed: {timedelta(seconds=int(elapsed))}", style="dim")
+            elapsed = self._time() - self._start_time
+            header.append(f"  |  Elapsed: {_format_duration(elapsed)}", style="dim")
 
-        self.console.print(Panel(header, title="Progress"))
+        layout = self._layout
+        layout["header"].update(Panel(header, title="Progress"))
 
         # Sites table
         if self.sites:
-            sites_table = Table(title="Site Crawling Progress")
-            sites_table.add_column("Site", style="cyan")
-            sites_table.add_column("Products", justify="right")
-            sites_table.add_column("Target", justify="right")
-            sites_table.add_column("Pages", justify="right")
-            sites_table.add_column("Rate", justify="right")
-            sites_table.add_column("Progress", justify="center")
-            sites_table.add_column("Status")
+            sites_table = self._new_table(self._site_columns, "Site Crawling Progress")
 
             for name, site in self.sites.items():
                 progress_pct = (site.products / site.target * 100) if site.target > 0 else 0
@@ -589,14 +1441,12 @@ class ProgressTracker:
                     Text(site.status, style=status_style)
                 )
 
-            self.console.print(sites_table)
+            layout["sites"].update(sites_table)
+            layout["sites"].visible = True
 
         # Matching progress
         if self.state.status == Status.MATCHING.value or self.matching.completed > 0:
-            self.console.print()
-            match_table = Table(title="Matching Progress")
-            match_table.add_column("Metric", style="cyan")
-            match_table.add_column("Value", justify="right")
+            match_table = self._new_table(self._match_columns, "Matching Progress")
 
             progress_pct = (
                 self.matching.completed / self.matching.total * 100
@@ -607,8 +1457,7 @@ class ProgressTracker:
             match_table.add_row("Rate", f"{self.matching.rate:.2f} matches/sec")
 
             if self.matching.eta_seconds:
-                eta = timedelta(seconds=int(self.matching.eta_seconds))
-                match_table.add_row("ETA", str(eta))
+                match_table.add_row("ETA", self._eta_str(self.matching.eta_seconds))
 
             if self.matching.current:
                 match_table.add_row("Current", self.matching.current[:40] + "...")
@@ -619,35 +1468,41 @@ class ProgressTracker:
                     f"{self.matching.best_match[:30]}... ({self.matching.best_score:.2f})"
                 )
 
-            self.console.print(match_table)
+            layout["matching"].update(match_table)
+            layout["matching"].visible = True
 
-        # Recent matches
-        if self._recent_matches:
-            self.console.print()
-            recent_table = Table(title="Recent Matches")
-            recent_table.add_column("Source", style="cyan", max_width=30)
-            recent_table.add_column("Target", style="green", max_width=30)
-            recent_table.add_column("Score", justify="right")
+        # Recent matches: copied under the lock update_matching appends
+        # under, so a concurrent append cannot break the iteration
+        with self._lock:
+            recent = list(self._recent_matches)[-5:]
+        if recent:
+            recent_table = self._new_table(self._recent_columns, "Recent Matches")
 
-            for match in self._recent_matches[-5:]:
-                score_style = "green" if match["score"] >= 0.8 else "yellow" if match["score"] >= 0.5 else "red"
+            for match in recent:
+                score = match["score"]
                 recent_table.add_row(
                     match["source"],
                     match["target"],
-                    Text(f"{match['score']:.3f}", style=score_style)
+                    Text(f"{score:.3f}", style=_SCORE_STYLES[_score_tier(score)])
                 )
 
-            self.console.print(recent_table)
+            layout["recent"].update(recent_table)
+            layout["recent"].visible = True
 
         # Errors
         if self.state.errors:
-            self.console.print()
-            self.console.print(
+            layout["errors"].update(
                 Panel(
-                    f"[red]Errors: {len(self.state.errors)}[/red]",
+                    f"[red]Errors: {self.state.errors_count}[/red]",
                     title="Warnings"
                 )
             )
+            layout["errors"].visible = True
+
+    @staticmethod
+    def _new_table(columns: List['Column'], title: str) -> 'Table':
+        """Create a table from prebuilt column definitions."""
+        return Table(*(column.copy() for column in columns), title=title)
 
     def _text_progress_bar(self, percentage: float, width: int = 20) -> str:
         """Create a text-based progress bar."""
@@ -657,7 +1512,9 @@ class ProgressTracker:
 
     def _stop_terminal_ui(self) -> None:
         """Stop the terminal UI."""
-        pass
+        if self.enable_terminal_ui and self._live is not None:
+            # Keep the reference so late updates don't restart the display
+            self._live.stop()
 
     def _print_final_summary(self, summary: Dict) -> None:
         """Print final summary to terminal."""
@@ -689,275 +1546,109 @@ class ProgressTracker:
     # HTML Dashboard
     # =========================================================================
 
-    def _generate_html_dashboard(self) -> None:
-        """Generate an auto-refreshing HTML dashboard."""
-        if not self.enable_html_dashboard:
-            return
-
-        # Calculate progress percentages
+    def _dashboard_context(self, snapshot: Dict) -> Dict:
+        """Derive the values the dashboard templates need from a snapshot."""
         site_data = []
-        for name, site in self.sites.items():
-            pct = (site.products / site.target * 100) if site.target > 0 else 0
+        for name, site in snapshot["sites"].items():
+            target = site["target"]
+            pct = (site["products"] / target * 100) if target > 0 else 0
             site_data.append({
                 "name": name,
-                "products": site.products,
-                "target": site.target,
-                "pages": site.pages,
-                "rate": f"{site.rate:.1f}",
+                "name_upper": _escape(name.upper()),
+                "products": site["products"],
+                "target": target,
+                "pages": site["pages"],
+                "rate": f"{site['rate']:.1f}",
                 "progress": round(pct, 1),
-                "status": site.status
+                "status": site["status"]
             })
 
+        matching = snapshot["matching"]
         match_pct = (
-            self.matching.completed / self.matching.total * 100
-        ) if self.matching.total > 0 else 0
-
-        eta_str = str(timedelta(seconds=int(self.matching.eta_seconds))) if self.matching.eta_seconds else "N/A"
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta http-equiv="refresh" content="2">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>URL Mapper Progress Dashboard</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            color: #e0e0e0;
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{
-            font-size: 2.5rem;
-            background: linear-gradient(90deg, #00d4ff, #00ff88);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }}
-        .status-badge {{
-            display: inline-block;
-            padding: 8px 20px;
-            border-radius: 20px;
-            font-weight: bold;
-            text-transform: uppercase;
-            font-size: 0.9rem;
-        }}
-        .status-crawling {{ background: #f59e0b; color: #000; }}
-        .status-matching {{ background: #06b6d4; color: #000; }}
-        .status-completed {{ background: #10b981; color: #000; }}
-        .status-idle {{ background: #6b7280; }}
-        .status-error {{ background: #ef4444; }}
-
-        .grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .card {{
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 16px;
-            padding: 24px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        .card h3 {{
-            color: #00d4ff;
-            margin-bottom: 16px;
-            font-size: 1.2rem;
-        }}
-        .progress-container {{
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 10px;
-            height: 24px;
-            overflow: hidden;
-            margin: 10px 0;
-        }}
-        .progress-bar {{
-            height: 100%;
-            border-radius: 10px;
-            transition: width 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            font-size: 0.8rem;
-        }}
-        .progress-crawl {{
-            background: linear-gradient(90deg, #f59e0b, #fbbf24);
-            color: #000;
-        }}
-        .progress-match {{
-            background: linear-gradient(90deg, #06b6d4, #22d3ee);
-            color: #000;
-        }}
-        .stat {{
-            display: flex;
-            justify-content: space-between;
-            padding: 8px 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        .stat:last-child {{
-            border-bottom: none;
-        }}
-        .stat-value {{
-            font-weight: bold;
-            color: #00ff88;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        th {{
-            color: #00d4ff;
-            font-weight: 600;
-        }}
-        .score-high {{ color: #10b981; }}
-        .score-medium {{ color: #f59e0b; }}
-        .score-low {{ color: #ef4444; }}
+            matching["completed"] / matching["total"] * 100
+        ) if matching["total"] > 0 else 0
 
-        .timestamp {{
-            text-align: center;
-            color: #6b7280;
-            font-size: 0.85rem;
-            margin-top: 20px;
-        }}
-        .pulse {{
-            animation: pulse 2s infinite;
-        }}
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.5; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>URL-to-URL Mapper</h1>
-            <span class="status-badge status-{self.state.status}">{self.state.status.upper()}</span>
-            {'<span class="pulse" style="margin-left: 10px;">Processing...</span>' if self.state.status in ['crawling', 'matching'] else ''}
-        </div>
+        eta_str = self._eta_str(matching["eta_seconds"])
 
-        <div class="grid">
-            <!-- Site Progress Cards -->
-            {''.join(f"""
-            <div class="card">
-                <h3>{site['name'].upper()}</h3>
-                <div class="progress-container">
-                    <div class="progress-bar progress-crawl" style="width: {site['progress']}%">
-                        {site['progress']:.1f}%
-                    </div>
-                </div>
-                <div class="stat">
-                    <span>Products</span>
-                    <span class="stat-value">{site['products']} / {site['target']}</span>
-                </div>
-                <div class="stat">
-                    <span>Pages</span>
-                    <span class="stat-value">{site['pages']}</span>
-                </div>
-                <div class="stat">
-                    <span>Rate</span>
-                    <span class="stat-value">{site['rate']}/s</span>
-                </div>
-                <div class="stat">
-                    <span>Status</span>
-                    <span class="stat-value">{site['status']}</span>
-                </div>
-            </div>
-            """ for site in site_data)}
+        return {
+            "status": snapshot["status"],
+            "sites": site_data,
+            "matching": matching,
+            "match_pct": match_pct,
+            "eta": eta_str,
+            "recent_matches": matching["recent_matches"],
+            "errors": snapshot["errors"],
+            "errors_count": snapshot["errors_count"],
+            "last_update": snapshot["last_update"],
+        }
 
-            <!-- Matching Progress Card -->
-            <div class="card">
-                <h3>MATCHING PROGRESS</h3>
-                <div class="progress-container">
-                    <div class="progress-bar progress-match" style="width: {match_pct:.1f}%">
-                        {match_pct:.1f}%
-                    </div>
-                </div>
-                <div class="stat">
-                    <span>Completed</span>
-                    <span class="stat-value">{self.matching.completed} / {self.matching.total}</span>
-                </div>
-                <div class="stat">
-                    <span>Rate</span>
-                    <span class="stat-value">{self.matching.rate:.2f}/s</span>
-                </div>
-                <div class="stat">
-                    <span>ETA</span>
-                    <span class="stat-value">{eta_str}</span>
-                </div>
-                {f'''<div class="stat">
-                    <span>Current</span>
-                    <span class="stat-value" style="font-size: 0.8rem;">{self.matching.current[:30] if self.matching.current else "N/A"}...</span>
-                </div>''' if self.matching.current else ''}
-            </div>
-        </div>
+    def _generate_html_dashboard(self, snapshot: Dict) -> bool:
+        """
+        Generate an auto-refreshing HTML dashboard.
 
-        <!-- Recent Matches Table -->
-        {f'''
-        <div class="card">
-            <h3>RECENT MATCHES</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Source</th>
-                        <th>Target</th>
-                        <th>Score</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(f"""
-                    <tr>
-                        <td>{match['source']}</td>
-                        <td>{match['target']}</td>
-                        <td class="{'score-high' if match['score'] >= 0.8 else 'score-medium' if match['score'] >= 0.5 else 'score-low'}">{match['score']:.3f}</td>
-                    </tr>
-                    """ for match in self._recent_matches[-10:])}
-                </tbody>
-            </table>
-        </div>
-        ''' if self._recent_matches else ''}
+        Renders from a state snapshot rather than the live objects, so the
+        page is consistent even while updates continue on other threads.
 
-        <!-- Errors -->
-        {f'''
-        <div class="card" style="border-color: rgba(239, 68, 68, 0.5);">
-            <h3 style="color: #ef4444;">ERRORS ({len(self.state.errors)})</h3>
-            {''.join(f"<p style='color: #fca5a5; margin: 8px 0;'>{err['error']}</p>" for err in self.state.errors[-5:])}
-        </div>
-        ''' if self.state.errors else ''}
+        Returns:
+            True if the dashboard file was written
+        """
+        if not self.enable_html_dashboard:
+            return False
 
-        <p class="timestamp">Last updated: {self.state.last_update}</p>
-    </div>
-</body>
-</html>"""
+        ctx = self._dashboard_context(snapshot)
 
+        # Stream fragments straight into the file; the atomic rename means
+        # the browser never loads a half-written page
         try:
-            with open(self.dashboard_file, 'w') as f:
-                f.write(html)
+            with _atomic_open(self.dashboard_file, 'w', buffering=1 << 16) as f:
+                f.write(self._html_head)
+                f.writelines(self._render_dashboard(ctx))
+                f.write(self._html_tail)
         except Exception as e:
             print(f"Warning: Could not write HTML dashboard: {e}")
+            return False
+        return True
+
+    def _render_dashboard(self, ctx: Dict) -> Iterator[str]:
+        """Yield the dashboard body fragments filled from a context dict."""
+        matching = ctx["matching"]
+
+        yield _DASHBOARD_OPEN_TPL.format(badge=_STATUS_BADGE_HTML[ctx["status"]])
+        for site in ctx["sites"]:
+            yield _SITE_CARD_TPL.format_map(site)
+
+        current = matching["current"]
+        yield _MATCHING_CARD_TPL.format_map({
+            "pct": ctx["match_pct"],
+            "completed": matching["completed"],
+            "total": matching["total"],
+            "rate": matching["rate"],
+            "eta": ctx["eta"],
+            "current": _CURRENT_STAT_TPL.format(current=_escape(current[:30])) if current else '',
+        })
+
+        recent_matches = ctx["recent_matches"]
+        if recent_matches:
+            yield _RECENT_MATCHES_HEAD
+            for match in recent_matches:
+                score = match['score']
+                yield _MATCH_ROW_TPL.format_map({
+                    "source": _escape(match['source']),
+                    "target": _escape(match['target']),
+                    "score_class": _SCORE_CLASSES[_score_tier(score)],
+                    "score": f"{score:.3f}",
+                })
+            yield _RECENT_MATCHES_TAIL
+
+        yield _ERRORS_MARKER
+        errors = ctx["errors"]
+        if errors:
+            yield _ERRORS_HEAD_TPL.format(count=ctx["errors_count"])
+            for err in errors[-5:]:
+                yield _ERROR_ROW_TPL.format(error=_escape(err['error']))
+            yield _ERRORS_TAIL
+
+        yield _DASHBOARD_CLOSE_TPL.format(last_update=ctx["last_update"])
 
     # =========================================================================
     # Context Manager Support
@@ -970,10 +1661,8 @@ class ProgressTracker:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context manager."""
         if exc_type is not None:
-            self.report_error(str(exc_val), {"exception_type": str(exc_type)})
-            self.state.status = Status.ERROR.value
-            self._save_state()
-        elif self.state.status != Status.COMPLETED.value:
+            self._finalize(Status.ERROR.value, str(exc_val), {"exception_type": str(exc_type)})
+        elif not self._finalized:
             self.complete()
 
 
@@ -994,37 +1683,138 @@ def load_progress(output_dir: str) -> Optional[Dict]:
     progress_file = Path(output_dir) / "progress.json"
     if progress_file.exists():
         try:
-            with open(progress_file) as f:
-                return json.load(f)
+            with open(progress_file, 'rb') as f:
+                return _loads(f.read())
         except Exception:
             return None
     return None
 
 
+def load_progress_mmap(output_dir: str, retries: int = 10) -> Optional[Dict]:
+    """
+    Load progress from the shared progress.mmap snapshot.
+
+    Only available when the tracker was created with enable_mmap=True.
+    Retries when it catches the tracker mid-write.
+
+    Args:
+        output_dir: Directory containing progress.mmap
+        retries: Attempts before giving up on a consistent read
+
+    Returns:
+        Progress data dict or None if unavailable
+    """
+    mmap_file = Path(output_dir) / "progress.mmap"
+    if not mmap_file.exists():
+        return None
+
+    try:
+        with open(mmap_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for _ in range(retries):
+                version, length = _MMAP_HEADER.unpack_from(mm, 0)
+                if version % 2 == 0 and length:
+                    payload = mm[_MMAP_HEADER.size:_MMAP_HEADER.size + length]
+                    if _MMAP_HEADER.unpack_from(mm, 0)[0] == version:
+                        return _loads(payload)
+                time.sleep(0.001)
+    except Exception:
+        return None
+    return None
+
+
 def watch_progress(output_dir: str, callback: Callable[[Dict], None], interval: float = 1.0) -> None:
     """
     Watch progress file and call callback on changes.
 
+    Uses filesystem notifications via 'watchdog' when it is installed and
+    falls back to polling the file's mtime otherwise.
+
     Args:
         output_dir: Directory containing progress.json
         callback: Function to call with progress data
-        interval: Check interval in seconds
+        interval: Check interval in seconds (polling fallback)
     """
     progress_file = Path(output_dir) / "progress.json"
-    last_mtime = 0
+
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        _poll_progress(progress_file, callback, interval)
+        return
+
+    if not progress_file.parent.is_dir():
+        _poll_progress(progress_file, callback, interval)
+        return
+
+    target = os.path.abspath(progress_file)
+    done = threading.Event()
+    deliver_lock = threading.Lock()
+    last_mtime_ns = 0
+
+    def deliver() -> None:
+        nonlocal last_mtime_ns
+        with deliver_lock:
+            try:
+                mtime_ns = os.stat(target).st_mtime_ns
+                if mtime_ns == last_mtime_ns:
+                    return
+                with open(target, 'rb') as f:
+                    data = _loads(f.read())
+                last_mtime_ns = mtime_ns
+            except Exception:
+                return
+
+            callback(data)
+            if data.get("status") == "completed":
+                done.set()
+
+    class _ProgressFileHandler(FileSystemEventHandler):
+        """Forward changes to progress.json only, ignoring its siblings."""
+
+        def on_any_event(self, event) -> None:
+            if event.event_type not in ("created", "modified", "moved"):
+                return
+            # The tracker replaces the file by rename, so check the destination
+            path = getattr(event, "dest_path", "") or event.src_path
+            if os.path.abspath(os.fsdecode(path)) == target:
+                deliver()
+
+    observer = Observer()
+    observer.schedule(_ProgressFileHandler(), str(progress_file.parent), recursive=False)
+    observer.start()
+    try:
+        deliver()  # Current state, if the file already exists
+        while not done.wait(interval):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def _poll_progress(progress_file: Path, callback: Callable[[Dict], None], interval: float) -> None:
+    """Polling fallback for watch_progress()."""
+    path_str = str(progress_file)
+    last_mtime_ns = 0
 
     while True:
         try:
-            if progress_file.exists():
-                mtime = progress_file.stat().st_mtime
-                if mtime > last_mtime:
-                    last_mtime = mtime
-                    with open(progress_file) as f:
-                        data = json.load(f)
-                    callback(data)
-
-                    if data.get("status") == "completed":
-                        break
+            try:
+                mtime_ns = os.stat(path_str).st_mtime_ns
+            except FileNotFoundError:
+                time.sleep(interval)
+                continue
+
+            if mtime_ns != last_mtime_ns:
+                last_mtime_ns = mtime_ns
+                with open(path_str, 'rb') as f:
+                    data = _loads(f.read())
+                callback(data)
+
+                if data.get("status") == "completed":
+                    break
 
             time.sleep(interval)
         except KeyboardInterrupt:
@@ -15,6 +15,9 @@ Run from the project root:
 
 Or directly:
     python crawler/test_progress_tracker.py
+
+Set PT_FAST_TEST=1 to replace the simulated work delays with a fake clock,
+so the automated tests run without sleeping.
 """
 
 import json
@@ -37,6 +40,26 @@ from crawler.progress_tracker import (
     RICH_AVAILABLE
 )
 
+# With PT_FAST_TEST set, simulated work advances a fake clock handed to the
+# tracker instead of sleeping, so rate/ETA math still sees elapsed time
+FAST = bool(os.environ.get("PT_FAST_TEST"))
+_fake_now = [time.time()]
+
+
+def _fake_clock() -> float:
+    return _fake_now[0]
+
+
+TIME_FUNC = _fake_clock if FAST else time.time
+
+
+def simulate_work(seconds: float) -> None:
+    """Wait for simulated work, or just advance the fake clock in fast mode."""
+    if FAST:
+        _fake_now[0] += seconds
+    else:
+        time.sleep(seconds)
+
 
 class VerboseCallback(ProgressCallback):
     """Callback that prints detailed information about events."""
@@ -77,7 +100,8 @@ def run_basic_test(output_dir: str) -> None:
         output_dir=output_dir,
         enable_terminal_ui=False,  # Disable for cleaner test output
         enable_html_dashboard=True,
-        callback=VerboseCallback()
+        callback=VerboseCallback(),
+        time_func=TIME_FUNC
     )
 
     # Start crawling site 1
@@ -85,7 +109,7 @@ def run_basic_test(output_dir: str) -> None:
     tracker.start_crawl("nykaa", target_products=20)
 
     for i in range(1, 21):
-        time.sleep(0.05)  # Simulate work
+        simulate_work(0.05)  # Simulate work
         tracker.update_crawl(
             "nykaa",
             products_found=i,
@@ -101,7 +125,7 @@ def run_basic_test(output_dir: str) -> None:
     tracker.start_crawl("purplle", target_products=25)
 
     for i in range(1, 26):
-        time.sleep(0.05)
+        simulate_work(0.05)
         tracker.update_crawl(
             "purplle",
             products_found=i,
@@ -117,7 +141,7 @@ def run_basic_test(output_dir: str) -> None:
     tracker.start_matching(source_count=20, target_count=25)
 
     for i in range(1, 21):
-        time.sleep(0.05)
+        simulate_work(0.05)
         score = random.uniform(0.4, 0.95)
         target_idx = random.randint(1, 25)
 
@@ -156,7 +180,8 @@ def run_error_handling_test(output_dir: str) -> None:
         total_sites=1,
         output_dir=output_dir,
         enable_terminal_ui=False,
-        enable_html_dashboard=False
+        enable_html_dashboard=False,
+        time_func=TIME_FUNC
     )
 
     tracker.start_crawl("test_site", target_products=10)
@@ -164,7 +189,7 @@ def run_error_handling_test(output_dir: str) -> None:
     # Simulate some progress
     for i in range(1, 6):
         tracker.update_crawl("test_site", i, 1)
-        time.sleep(0.02)
+        simulate_work(0.02)
 
     # Report an error
     tracker.report_error(
@@ -175,7 +200,7 @@ def run_error_handling_test(output_dir: str) -> None:
     # Continue with more progress
     for i in range(6, 11):
         tracker.update_crawl("test_site", i, 2)
-        time.sleep(0.02)
+        simulate_work(0.02)
 
     # Report another error
     tracker.report_error(
@@ -202,12 +227,13 @@ def run_context_manager_test(output_dir: str) -> None:
         total_sites=1,
         output_dir=output_dir,
         enable_terminal_ui=False,
-        enable_html_dashboard=False
+        enable_html_dashboard=False,
+        time_func=TIME_FUNC
     ) as tracker:
         tracker.start_crawl("context_test", 5)
         for i in range(1, 6):
             tracker.update_crawl("context_test", i, 1)
-            time.sleep(0.02)
+            simulate_work(0.02)
         tracker.complete_crawl("context_test", 5)
 
     progress_data = load_progress(output_dir)
@@ -223,7 +249,8 @@ def run_context_manager_test(output_dir: str) -> None:
             total_sites=1,
             output_dir=error_dir,
             enable_terminal_ui=False,
-            enable_html_dashboard=False
+            enable_html_dashboard=False,
+            time_func=TIME_FUNC
         ) as tracker:
             tracker.start_crawl("error_test", 10)
             tracker.update_crawl("error_test", 5, 1)
@@ -2,72 +2,104 @@
 Generate HTML report from matches CSV.
 """
 
+import csv
 import json
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+import numpy as np
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = (orjson.JSONDecodeError, TypeError)
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = (json.JSONDecodeError, TypeError)
+
+# Template is compiled once per process; auto_reload skips the mtime check per render.
+# Product titles and URLs come from scraped pages, so HTML output is autoescaped.
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False,
+)
+
+
+@lru_cache(maxsize=None)
+def _get_report_template():
+    """Load and compile report_template.html on first use."""
+    return _JINJA_ENV.get_template('report_template.html')
+
+
+def _parse_bool(value) -> bool:
+    """Parse a CSV boolean cell ('True', 'false', '1', '')."""
+    return str(value).strip().lower() in ('true', '1', 'yes')
+
+
+# top_5_candidates cells that decode to nothing; skipped without parsing
+_EMPTY_TOP_5 = frozenset(('', '[]', 'null'))
+
+
+def _row_to_match(row: dict, has_top_5: bool = True) -> dict:
+    """Convert one CSV row (all strings) to a match dict."""
+    # Parse top_5_candidates if present
+    top_5 = []
+    raw_top_5 = row.get('top_5_candidates') if has_top_5 else None
+    if raw_top_5 and raw_top_5 not in _EMPTY_TOP_5:
+        try:
+            top_5 = _json_loads(raw_top_5)
+        except _JSONDecodeError:
+            pass
+
+    return {
+        'source_url': row.get('source_url') or '',
+        'source_title': row.get('source_title') or '',
+        'source_brand': row.get('source_brand') or '',
+        'best_match_url': row.get('best_match_url') or '',
+        'best_match_title': row.get('best_match_title') or '',
+        'match_brand': row.get('match_brand') or '',
+        'confidence': int(float(row.get('confidence') or 0)),
+        'confidence_label': row.get('confidence_label') or '',
+        'raw_score': float(row.get('raw_score') or 0),
+        'why_not_100': row.get('why_not_100') or '',
+        'needs_review': _parse_bool(row.get('needs_review', False)),
+        'top_5_candidates': top_5[:5] if top_5 else [],
+    }
 
 
 def load_matches(csv_path: str) -> list[dict]:
     """Load matches from CSV file."""
-    import pandas as pd
-    df = pd.read_csv(csv_path)
-
-    matches = []
-    for _, row in df.iterrows():
-        # Parse top_5_candidates if present
-        top_5 = []
-        if pd.notna(row.get('top_5_candidates', '')):
-            try:
-                top_5 = json.loads(row['top_5_candidates'])
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        matches.append({
-            'source_url': row.get('source_url', ''),
-            'source_title': row.get('source_title', ''),
-            'source_brand': row.get('source_brand', ''),
-            'best_match_url': row.get('best_match_url', ''),
-            'best_match_title': row.get('best_match_title', ''),
-            'match_brand': row.get('match_brand', ''),
-            'confidence': int(row.get('confidence', 0)),
-            'confidence_label': row.get('confidence_label', ''),
-            'raw_score': float(row.get('raw_score', 0)),
-            'why_not_100': row.get('why_not_100', ''),
-            'needs_review': row.get('needs_review', False),
-            'top_5_candidates': top_5[:5] if top_5 else [],
-        })
-
-    return matches
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        has_top_5 = 'top_5_candidates' in (reader.fieldnames or ())
+        return [_row_to_match(row, has_top_5) for row in reader]
+
+
+# Lower confidence bound of each bucket above no_match; searchsorted(side='right')
+# maps a confidence to the index of its bucket in _STAT_KEYS.
+_CONFIDENCE_EDGES = np.array([50, 70, 80, 90, 100], dtype=np.int16)
+_STAT_KEYS = (
+    'no_match',
+    'manual_review',
+    'likely_match',
+    'good_match',
+    'high_confidence',
+    'exact_match',
+)
 
 
 def calculate_stats(matches: list[dict]) -> dict:
     """Calculate summary statistics."""
-    stats = {
-        'exact_match': 0,
-        'high_confidence': 0,
-        'good_match': 0,
-        'likely_match': 0,
-        'manual_review': 0,
-        'no_match': 0,
-    }
-
-    for m in matches:
-        conf = m['confidence']
-        if conf >= 100:
-            stats['exact_match'] += 1
-        elif conf >= 90:
-            stats['high_confidence'] += 1
-        elif conf >= 80:
-            stats['good_match'] += 1
-        elif conf >= 70:
-            stats['likely_match'] += 1
-        elif conf >= 50:
-            stats['manual_review'] += 1
-        else:
-            stats['no_match'] += 1
+    confs = np.fromiter((m['confidence'] for m in matches), dtype=np.int16, count=len(matches))
+    buckets = np.searchsorted(_CONFIDENCE_EDGES, confs, side='right')
+    counts = np.bincount(buckets, minlength=len(_STAT_KEYS))
 
+    stats = dict.fromkeys(reversed(_STAT_KEYS), 0)
+    for key, count in zip(_STAT_KEYS, counts.tolist()):
+        stats[key] = count
     return stats
 
 
@@ -87,16 +119,18 @@ def generate_report(
     # Calculate stats
     stats = calculate_stats(matches)
 
-    # Sort by confidence (review items first, then by score desc)
-    matches.sort(key=lambda x: (not x['needs_review'], -x['confidence'], -x['raw_score']))
-
-    # Load template
-    template_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template('report_template.html')
+    # Sort by confidence (review items first, then by score desc). Plain
+    # tuples sort without a key lambda, and the trailing index keeps ties in
+    # input order without comparing the match dicts
+    decorated = [
+        (not m['needs_review'], -m['confidence'], -m['raw_score'], i)
+        for i, m in enumerate(matches)
+    ]
+    decorated.sort()
+    matches = [matches[d[3]] for d in decorated]
 
     # Render
-    html = template.render(
+    html = _get_report_template().render(
         report_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
         source_name=source_name,
         target_name=target_name,
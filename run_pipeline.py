@@ -39,28 +39,37 @@ Created: 2026-01-07
 import argparse
 import asyncio
 import csv
+import hashlib
+import io
 import json
 import logging
 import os
+import re
 import signal
 import sys
 import threading
 import time
 import webbrowser
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache, partial
+from itertools import cycle, islice
 from pathlib import Path
-from queue import Queue, Empty
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from queue import Queue
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 # Local imports
 from crawler import ProgressTracker, Status
 
 # Conditional imports for optional features
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.live import Live
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
@@ -71,11 +80,115 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+try:
+    from rapidfuzz import fuzz, process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, default=_json_default).encode()
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays for the stdlib json fallback."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Column order of matches.csv, shared by every matching path
+MATCH_FIELDNAMES = (
+    'source_url', 'source_title', 'source_brand',
+    'best_match_url', 'best_match_title', 'best_match_brand',
+    'score', 'timestamp'
+)
+PRODUCT_FIELDNAMES = ('url', 'title', 'brand', 'category', 'price')
+
+# 1 MB write buffer so large outputs go out in a few syscalls
+_WRITE_BUFFER = 1 << 20
+
+# CSVs below this size are read and decoded in one call before parsing
+_READ_WHOLE_LIMIT = 1_000_000_000
+
+# Products loaded between crawl progress updates (and event loop yields)
+_PROGRESS_EVERY = 100
+
+
+def _write_csv(file_path: Path, fieldnames: Tuple[str, ...], records: List[Dict]) -> None:
+    """
+    Write dicts as CSV rows in a single writerows call.
+
+    Rows are built positionally from the fieldnames, which skips
+    DictWriter's per-row key validation. Missing fields are written as
+    empty.
+    With polars or pyarrow installed the columns are written natively
+    instead.
+    """
+    if POLARS_AVAILABLE or PYARROW_AVAILABLE:
+        columns = {
+            name: ['' if (value := record.get(name, '')) is None else str(value) for record in records]
+            for name in fieldnames
+        }
+        if POLARS_AVAILABLE:
+            pl.DataFrame(columns, schema={name: pl.String for name in fieldnames}).write_csv(file_path)
+        else:
+            table = pa.table({name: pa.array(values, type=pa.string()) for name, values in columns.items()})
+            pacsv.write_csv(table, str(file_path), write_options=pacsv.WriteOptions(quoting_style='needed'))
+        return
+
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([record.get(name, '') for name in fieldnames] for record in records)
+
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the pipeline run."""
     # Sites
@@ -100,21 +213,27 @@ class PipelineConfig:
     match_only: bool = False
     interactive: bool = True
     dashboard: bool = False
+    simulate_delay: bool = False  # Pace CSV/demo loading like a real crawl
 
     # Performance tuning
-    parallel_browsers: int = 2
+    parallel_browsers: int = 2  # concurrent page fetches per site
     rate_limit: int = 30  # requests per minute per site
+    max_concurrent_sites: int = 4  # sites crawled at the same time
 
     # Matching parameters
     top_k: int = 25
     threshold: float = 0.5
     model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    quantize_embeddings: bool = False  # int8 Site B embeddings (4x less memory)
+    ann_index: bool = False  # HNSW top_k search over Site B (needs faiss)
+    hnsw_m: int = 32
+    hnsw_ef_search: int = 64
 
     # Resume
     resume_from: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlCheckpoint:
     """Checkpoint state for resumable crawling."""
     timestamp: str
@@ -130,6 +249,73 @@ class CrawlCheckpoint:
     status: str = "in_progress"
 
 
+class CheckpointStore:
+    """
+    Checkpoint persisted as a JSON snapshot plus a JSONL log of changes.
+
+    Each save appends only the fields that changed since the previous one;
+    every `compact_every` saves the snapshot is rewritten and the log
+    cleared. Loading replays the log over the snapshot.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_every: int = 50):
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path.with_suffix('.jsonl')
+        self.compact_every = compact_every
+        self._last: Dict[str, Any] = {}
+        self._deltas = 0
+        self._fp = None
+
+    def save(self, checkpoint: CrawlCheckpoint, compact: bool = False) -> None:
+        """Record the checkpoint, as a delta unless a compaction is due."""
+        state = asdict(checkpoint)
+        if compact or not self._last or self._deltas >= self.compact_every:
+            self._compact(state)
+            return
+
+        delta = {k: v for k, v in state.items() if self._last.get(k) != v}
+        if not delta:
+            return
+        if self._fp is None:
+            self._fp = open(self.log_path, 'ab')
+        self._fp.write(_json_dumps(delta) + b'\n')
+        self._fp.flush()
+        self._deltas += 1
+        self._last = state
+
+    def _compact(self, state: Dict[str, Any]) -> None:
+        """Write the full snapshot atomically and drop the replayed log."""
+        tmp_path = self.snapshot_path.with_suffix('.tmp')
+        tmp_path.write_bytes(_json_dumps(state, pretty=True))
+        os.replace(tmp_path, self.snapshot_path)
+
+        self.close()
+        self.log_path.unlink(missing_ok=True)
+        self._last = state
+        self._deltas = 0
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the snapshot with logged changes applied, or None."""
+        state: Dict[str, Any] = {}
+        if self.snapshot_path.exists():
+            state = _json_loads(self.snapshot_path.read_bytes())
+        if self.log_path.exists():
+            for line in self.log_path.read_bytes().splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    state.update(_json_loads(line))
+                except ValueError:
+                    break  # Torn final line from an interrupted write
+        return state or None
+
+    def close(self) -> None:
+        """Close the delta log."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+
 # ============================================================================
 # Live Terminal Display (Rich)
 # ============================================================================
@@ -162,6 +348,19 @@ class LiveDisplay:
         self.last_match: Optional[Dict] = None
         self.errors: List[str] = []
 
+        # Progress table: labels are fixed for the run, so the table is
+        # built once and only the Value cells are replaced on each render
+        self._table: Optional[Table] = None
+        if RICH_AVAILABLE:
+            self._table = Table(title="Pipeline Progress", expand=True)
+            self._table.add_column("Metric", style="cyan", no_wrap=True)
+            self._table.add_column("Value", style="green")
+            self._table.add_row(f"Site A ({config.site_a})", "")
+            self._table.add_row(f"Site B ({config.site_b})", "")
+            self._table.add_row("Matches Found", "")
+            self._table.add_row("Current Stage", "")
+        self._site_progress_format = "{count}/{target} ({pct:.1f}%)".format_map
+
     def _create_layout(self) -> Layout:
         """Create the display layout."""
         layout = Layout()
@@ -178,52 +377,50 @@ class LiveDisplay:
 
     def _render_progress_table(self) -> Table:
         """Render the progress table."""
-        table = Table(title="Pipeline Progress", expand=True)
-        table.add_column("Metric", style="cyan", no_wrap=True)
-        table.add_column("Value", style="green")
-
         # Site A progress
         a_pct = (self.site_a_count / self.config.target_products_a * 100
                  if self.config.target_products_a > 0 else 0)
-        table.add_row(
-            f"Site A ({self.config.site_a})",
-            f"{self.site_a_count}/{self.config.target_products_a} ({a_pct:.1f}%)"
-        )
-
         # Site B progress
         b_pct = (self.site_b_count / self.config.target_products_b * 100
                  if self.config.target_products_b > 0 else 0)
-        table.add_row(
-            f"Site B ({self.config.site_b})",
-            f"{self.site_b_count}/{self.config.target_products_b} ({b_pct:.1f}%)"
-        )
 
-        # Matches
-        table.add_row("Matches Found", str(self.match_count))
-
-        # Stage
-        table.add_row("Current Stage", self.current_stage)
-
-        return table
+        self._table.columns[1]._cells[:] = [
+            self._site_progress_format(
+                {"count": self.site_a_count, "target": self.config.target_products_a, "pct": a_pct}
+            ),
+            self._site_progress_format(
+                {"count": self.site_b_count, "target": self.config.target_products_b, "pct": b_pct}
+            ),
+            str(self.match_count),
+            self.current_stage,
+        ]
+        return self._table
 
     def _render_recent_products(self) -> Panel:
         """Render recent products panel."""
-        text = Text()
-        text.append("Recent Site A Products:\n", style="bold cyan")
-        for p in self.recent_products_a:
-            text.append(f"  - {p[:50]}...\n" if len(p) > 50 else f"  - {p}\n")
+        def lines(products) -> List[str]:
+            # Copy first: the deques are appended to while Live renders
+            return [f"  - {p[:50]}...\n" if len(p) > 50 else f"  - {p}\n" for p in tuple(products)]
+
+        parts: List[Any] = [
+            ("Recent Site A Products:\n", "bold cyan"),
+            *lines(self.recent_products_a),
+            ("\nRecent Site B Products:\n", "bold magenta"),
+            *lines(self.recent_products_b),
+        ]
 
-        text.append("\nRecent Site B Products:\n", style="bold magenta")
-        for p in self.recent_products_b:
-            text.append(f"  - {p[:50]}...\n" if len(p) > 50 else f"  - {p}\n")
+        last_match = self.last_match
+        if last_match:
+            parts.append(("\nLast Match:\n", "bold green"))
+            parts.append(f"  {last_match.get('source_title', '')[:40]} -> "
+                         f"{last_match.get('best_match_title', '')[:40]}\n")
+            parts.append(f"  Score: {last_match.get('score', 0):.2f}\n")
 
-        if self.last_match:
-            text.append("\nLast Match:\n", style="bold green")
-            text.append(f"  {self.last_match.get('source_title', '')[:40]} -> "
-                        f"{self.last_match.get('best_match_title', '')[:40]}\n")
-            text.append(f"  Score: {self.last_match.get('score', 0):.2f}\n")
+        return Panel(Text.assemble(*parts), title="Activity")
 
-        return Panel(text, title="Activity")
+    def _render(self) -> Group:
+        """Render the progress table above the recent activity panel."""
+        return Group(self._render_progress_table(), self._render_recent_products())
 
     def start(self) -> None:
         """Start the live display."""
@@ -238,7 +435,13 @@ class LiveDisplay:
             TimeElapsedColumn(),
             console=self.console,
         )
-        self._live = Live(self._render_progress_table(), refresh_per_second=2, console=self.console)
+        # Live pulls a fresh frame on its own 2 Hz refresh; update() only
+        # records values, so frequent product callbacks never render
+        self._live = Live(
+            get_renderable=self._render,
+            refresh_per_second=2,
+            console=self.console
+        )
         self._live.start()
 
     def stop(self) -> None:
@@ -272,9 +475,6 @@ class LiveDisplay:
         if last_match:
             self.last_match = last_match
 
-        if self._live:
-            self._live.update(self._render_progress_table())
-
     def print_status(self, message: str, style: str = "info") -> None:
         """Print a status message."""
         if RICH_AVAILABLE and self.console:
@@ -289,106 +489,574 @@ class LiveDisplay:
             print(message)
 
 
+# ============================================================================
+# Rate Limiting
+# ============================================================================
+
+class RateLimiter:
+    """
+    Asyncio token bucket allowing `rate` acquisitions per `period` seconds.
+
+    The bucket starts full, so short bursts up to `rate` go through
+    immediately; after that acquisitions are spaced at period / rate.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = max(rate, 1)
+        self._fill_rate = self.capacity / period
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self._fill_rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+
 # ============================================================================
 # Incremental Matching Queue
 # ============================================================================
 
+class EmbeddingCache:
+    """
+    Title embeddings persisted between runs for one model.
+
+    Rows are appended to a raw float32 file that is memory-mapped for
+    reads; a sidecar file holds the dimension on its first line, then one
+    blake2b title key per row. Only titles without a stored row are encoded.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        model_key = hashlib.blake2b(model_name.encode(), digest_size=8).hexdigest()
+        self._data_path = cache_dir / f"emb_{model_key}.f32"
+        self._keys_path = cache_dir / f"emb_{model_key}.keys"
+        self._rows: Dict[str, int] = {}
+        self._dim = 0
+        self._view: Optional[np.ndarray] = None
+        self._load()
+
+    @staticmethod
+    def _key(title: str) -> str:
+        return hashlib.blake2b(title.encode(), digest_size=16).hexdigest()
+
+    def _load(self) -> None:
+        """Read the key index, dropping rows left incomplete by a crash."""
+        if not self._keys_path.exists() or not self._data_path.exists():
+            return
+
+        lines = self._keys_path.read_text(encoding='utf-8').split()
+        if not lines:
+            return
+        self._dim = int(lines[0])
+        keys = lines[1:]
+        n_rows = min(len(keys), self._data_path.stat().st_size // (4 * self._dim))
+
+        if n_rows < len(keys) or self._data_path.stat().st_size != n_rows * 4 * self._dim:
+            with open(self._data_path, 'r+b') as f:
+                f.truncate(n_rows * 4 * self._dim)
+            keys = keys[:n_rows]
+            self._keys_path.write_text('\n'.join([str(self._dim), *keys]) + '\n', encoding='utf-8')
+
+        self._rows = {key: row for row, key in enumerate(keys)}
+
+    def _matrix(self) -> np.ndarray:
+        """Memory-map the stored rows (remapped after appends)."""
+        if self._view is None:
+            self._view = np.memmap(
+                self._data_path, dtype=np.float32, mode='r',
+                shape=(len(self._rows), self._dim)
+            )
+        return self._view
+
+    def encode(self, titles: List[str], encode_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Return embeddings for titles, encoding and storing only unseen ones."""
+        keys = [self._key(t) for t in titles]
+        missing: Dict[str, str] = {}
+        for key, title in zip(keys, titles):
+            if key not in self._rows:
+                missing.setdefault(key, title)
+
+        if missing:
+            emb = np.ascontiguousarray(encode_fn(list(missing.values())), dtype=np.float32)
+            if not self._rows:
+                self._dim = emb.shape[1]
+                self._data_path.write_bytes(b'')
+                self._keys_path.write_text(f"{self._dim}\n", encoding='utf-8')
+
+            # Data before keys, so a crash never indexes a missing row
+            with open(self._data_path, 'ab') as f:
+                f.write(emb.tobytes())
+            with open(self._keys_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{key}\n" for key in missing))
+
+            start = len(self._rows)
+            for offset, key in enumerate(missing):
+                self._rows[key] = start + offset
+            self._view = None
+
+        matrix = self._matrix()
+        return np.asarray(matrix[[self._rows[key] for key in keys]])
+
+
+# Title tokens used to prefilter difflib candidates
+_TOKEN_RE = re.compile(r'\w{3,}')
+_PREFILTER_LIMIT = 50
+
+# Batches with fewer (A, B) pairs are scored in-process; below this the
+# pickling round trip costs more than the parallel speedup
+_POOL_MIN_PAIRS = 20000
+_CPU_COUNT = os.cpu_count() or 1
+
+# Site B data of a difflib pool worker, set once by _init_difflib_worker
+_worker_site_b: Tuple[List[str], List[str], Dict[str, List[int]]] = ([], [], {})
+
+
+def _init_difflib_worker(
+    titles_lc: List[str],
+    brands_lc: List[str],
+    postings: Dict[str, List[int]]
+) -> None:
+    """Pool initializer: keep Site B in the worker so batches only carry queries."""
+    global _worker_site_b
+    _worker_site_b = (titles_lc, brands_lc, postings)
+
+
+def _difflib_best_match(
+    title_a: str,
+    brand_a: str,
+    titles_lc: List[str],
+    brands_lc: List[str],
+    postings: Dict[str, List[int]]
+) -> Tuple[int, float]:
+    """
+    Best Site B index and score for one lowercased title/brand, or (-1, 0.0).
+
+    Only the Site B products sharing the most title tokens are scored;
+    all of them are scored if no token is shared.
+    """
+    best_idx = -1
+    best_score = 0.0
+
+    shared = Counter()
+    # Sorted so ties in shared-token counts break the same way every run
+    for token in sorted(set(_TOKEN_RE.findall(title_a))):
+        shared.update(postings.get(token, ()))
+    if shared:
+        candidates = sorted(idx for idx, _ in shared.most_common(_PREFILTER_LIMIT))
+    else:
+        candidates = range(len(titles_lc))
+
+    for idx in candidates:
+        brand_b = brands_lc[idx]
+        # Title similarity
+        title_score = SequenceMatcher(None, title_a, titles_lc[idx]).ratio()
+
+        # Brand bonus
+        brand_bonus = 0.1 if brand_a and brand_b and (
+            brand_a in brand_b or brand_b in brand_a
+        ) else 0
+
+        score = title_score + brand_bonus
+
+        if score > best_score:
+            best_score = score
+            best_idx = idx
+
+    return best_idx, min(best_score, 1.0)
+
+
+def _difflib_best_matches(queries: List[Tuple[str, str]]) -> List[Tuple[int, float]]:
+    """Pool task: match a chunk of (title, brand) queries against the worker's Site B."""
+    titles_lc, brands_lc, postings = _worker_site_b
+    return [
+        _difflib_best_match(title_a, brand_a, titles_lc, brands_lc, postings)
+        for title_a, brand_a in queries
+    ]
+
+
+def _quantize_int8(emb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: emb ~= q * scale[:, None]."""
+    scales = np.abs(emb).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    q = np.rint(emb / scales[:, None]).astype(np.int8)
+    return q, scales.astype(np.float32)
+
+
+def _int8_scores(a_emb: np.ndarray, b_q: np.ndarray, b_scales: np.ndarray, block: int = 8192) -> np.ndarray:
+    """
+    Score float32 queries against int8 rows.
+
+    Dequantizes one block of rows at a time, so the float32 copy stays
+    cache-sized while the full matrix is read at one byte per value.
+    """
+    scores = np.empty((a_emb.shape[0], b_q.shape[0]), dtype=np.float32)
+    for start in range(0, b_q.shape[0], block):
+        stop = start + block
+        scores[:, start:stop] = a_emb @ b_q[start:stop].astype(np.float32).T
+    scores *= b_scales
+    return scores
+
+
+@lru_cache(maxsize=4)
+def _get_model(model_name: str):
+    """
+    Load a SentenceTransformer once per process and model name.
+
+    Runs on the GPU in FP16 when CUDA is available.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(model_name, device=device)
+    if device == "cuda":
+        model.half()
+    return model
+
+
 class IncrementalMatcher:
     """
     Handles incremental matching as products arrive.
 
     Products from Site A are queued and matched against Site B products
     in batches of N (default: 10) to provide real-time feedback.
+
+    Titles are compared by cosine similarity of sentence-transformer
+    embeddings: Site B is encoded incrementally as products arrive and each
+    batch is scored with a single matrix product. Falls back to string
+    similarity (RapidFuzz, else difflib) when the model cannot be loaded.
     """
 
     def __init__(
         self,
         batch_size: int = 10,
         threshold: float = 0.5,
-        model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        cache_dir: Optional[Path] = None,
+        quantize: bool = False,
+        top_k: int = 25,
+        ann_index: bool = False,
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 64
     ):
         self.batch_size = batch_size
         self.threshold = threshold
         self.model_name = model_name
-
-        # Queues
-        self.product_queue: Queue = Queue()
+        self.cache_dir = cache_dir  # Site B embedding cache; None disables it
+        self.quantize = quantize  # Keep Site B embeddings as int8 + row scales
+        # Approximate top_k search instead of scoring every Site B product;
+        # candidates are then re-ranked with the brand bonus
+        self.top_k = top_k
+        self.ann_index = ann_index and FAISS_AVAILABLE and not quantize
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_search = hnsw_ef_search
+
+        # Queues: bounded so a fast crawl waits for matching instead of
+        # piling up products in memory. Items are lists of products.
+        self.product_queue: asyncio.Queue = asyncio.Queue(maxsize=batch_size * 4)
         self.site_b_products: List[Dict] = []
-        self.matches: List[Dict] = []
+        self._b_visible = 0  # Leading site_b_products entries ready to match
+        self._b_final = False  # Site B will not grow any more
+        # Matches are not kept: they only reach on_match (e.g. to be
+        # streamed to disk) and just match_count is tracked
+        self.match_count = 0
 
         # State
         self._running = False
-        self._matcher = None
-        self._products_a_embeddings = None
-        self._products_b_embeddings = None
+        self._model = None
+        self._use_embeddings: Optional[bool] = None  # Decided on first batch
+        self._emb_cache: Optional[EmbeddingCache] = None
+        self._site_b_lock = threading.Lock()  # Batches are scored on executor threads
+        self._products_b_embeddings: Optional[np.ndarray] = None  # float32 or int8 [M, D]
+        self._b_scales: Optional[np.ndarray] = None  # float32 [M], int8 only
+        self._index = None  # faiss HNSW index over the Site B embeddings
+        # Distinct Site B brands: each product's brand id, and per Site A
+        # brand the bonus against every distinct brand
+        self._brand_ids: Dict[str, int] = {}
+        self._b_brand_id: np.ndarray = np.array([], dtype=np.int32)
+        self._brand_rows: Dict[str, np.ndarray] = {}
+        # Site B titles/brands lowercased once, in site_b_products order
+        self._b_titles_lc: List[str] = []
+        self._b_brands_lc: List[str] = []
+        # Title token -> Site B indices, difflib fallback only
+        self._b_postings: Dict[str, List[int]] = {}
+        self._b_synced = 0  # Site B products covered by the caches above
+        # difflib fallback workers, started once Site B is final
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_synced = 0
         self._logger = logging.getLogger("IncrementalMatcher")
 
         # Callbacks
         self.on_match: Optional[Callable[[Dict], None]] = None
         self.on_batch_complete: Optional[Callable[[int], None]] = None
 
-    def set_site_b_products(self, products: List[Dict]) -> None:
-        """Set the Site B products for matching against."""
-        self.site_b_products = products
-        self._logger.info(f"Site B products set: {len(products)} products")
+    def set_site_b_products(self, products: List[Dict], final: bool = False) -> None:
+        """
+        Set the Site B products for matching against.
+
+        Products are expected to only grow between calls (the crawl appends),
+        so the crawl's own list can be passed without copying: only its first
+        len(products) entries at call time are used until the next call. The
+        new tail is encoded off the event loop when a batch is scored.
+
+        Pass final=True once Site B is complete; only then is the difflib
+        process pool started, since its workers hold a copy of Site B.
+        """
+        with self._site_b_lock:
+            self.site_b_products = products
+            self._b_visible = len(products)
+            self._b_final = final
+        self._logger.info(f"Site B products set: {self._b_visible} products")
+
+    def _load_model(self) -> bool:
+        """Load the embedding model once; False if it is unavailable."""
+        if self._use_embeddings is None:
+            try:
+                self._model = _get_model(self.model_name)
+                self._use_embeddings = True
+                if self.cache_dir is not None:
+                    self._emb_cache = EmbeddingCache(self.cache_dir, self.model_name)
+            except Exception as e:
+                self._logger.warning(
+                    f"Embedding model unavailable ({e}), using string similarity"
+                )
+                self._use_embeddings = False
+        return self._use_embeddings
+
+    def _encode(self, titles: List[str], batch_size: int = 64) -> np.ndarray:
+        """Encode titles to L2-normalized float32 embeddings."""
+        return self._model.encode(
+            titles,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).astype(np.float32, copy=False)
+
+    def _sync_site_b(self) -> List[Dict]:
+        """
+        Lowercase (and encode) Site B products added since the last batch.
+
+        Returns the Site B list; only its first _b_synced entries are covered
+        by the caches, and it may have grown since.
+        """
+        with self._site_b_lock:
+            products = self.site_b_products
+            visible = self._b_visible
+
+        if self._b_synced > visible:
+            # The list was replaced by a shorter one; start over
+            self._products_b_embeddings = None
+            self._b_scales = None
+            self._index = None
+            self._b_titles_lc = []
+            self._b_brands_lc = []
+            self._b_postings = {}
+            self._brand_ids = {}
+            self._b_brand_id = np.array([], dtype=np.int32)
+            self._brand_rows = {}
+            self._b_synced = 0
+
+        new = products[self._b_synced:visible]
+        if new:
+            new_brands = [p.get('brand', '').lower() for p in new]
+            self._b_titles_lc.extend(p.get('title', '').lower() for p in new)
+            self._b_brands_lc.extend(new_brands)
+            distinct = len(self._brand_ids)
+            new_ids = [self._brand_ids.setdefault(b, len(self._brand_ids)) for b in new_brands]
+            self._b_brand_id = np.concatenate((self._b_brand_id, np.array(new_ids, dtype=np.int32)))
+            if len(self._brand_ids) > distinct:
+                self._brand_rows = {}  # Rows are one entry short now
+
+            if not self._use_embeddings and not RAPIDFUZZ_AVAILABLE:
+                for idx in range(self._b_synced, visible):
+                    for token in set(_TOKEN_RE.findall(self._b_titles_lc[idx])):
+                        self._b_postings.setdefault(token, []).append(idx)
+
+            if self._use_embeddings:
+                titles = [p.get('title', '') for p in new]
+                if self._emb_cache is not None:
+                    emb = self._emb_cache.encode(titles, self._encode)
+                else:
+                    emb = self._encode(titles)
+                if self.quantize:
+                    emb, scales = _quantize_int8(emb)
+                    self._b_scales = scales if self._b_scales is None else np.concatenate((self._b_scales, scales))
+                if self._products_b_embeddings is None:
+                    self._products_b_embeddings = emb
+                else:
+                    self._products_b_embeddings = np.vstack((self._products_b_embeddings, emb))
+                if self.ann_index:
+                    if self._index is None:
+                        self._index = faiss.IndexHNSWFlat(emb.shape[1], self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+                        self._index.hnsw.efSearch = self.hnsw_ef_search
+                    self._index.add(np.ascontiguousarray(emb))
+            self._b_synced = visible
+
+        return products
+
+    async def queue_products(self, products: List[Dict]) -> None:
+        """
+        Queue Site A products for matching as one item, waiting while the queue is full.
+
+        Raises the matching task's error (or RuntimeError if it was stopped)
+        instead of waiting forever on a queue nobody is draining.
+        """
+        if products and not await self._put(list(products)):
+            task = self._match_task
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+            raise RuntimeError("Matching task is not running")
+
+    async def _put(self, item: Optional[List[Dict]]) -> bool:
+        """
+        Put an item on the queue unless the matching task finishes first.
 
-    def queue_product(self, product: Dict) -> None:
-        """Queue a Site A product for matching."""
-        self.product_queue.put(product)
+        Returns:
+            False if the task had finished (or finished while the queue was
+            full), in which case nothing was queued
+        """
+        task = getattr(self, '_match_task', None)
+        if task is None:
+            await self.product_queue.put(item)
+            return True
+        if task.done():
+            return False
+
+        put = asyncio.ensure_future(self.product_queue.put(item))
+        try:
+            await asyncio.wait({put, task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        return put.done() and not put.cancelled()
 
     def start(self) -> None:
-        """Start the matching thread."""
+        """Start the matching task on the running event loop."""
         self._running = True
-        self._match_thread = threading.Thread(target=self._match_loop, daemon=True)
-        self._match_thread.start()
+        self._match_task = asyncio.create_task(self._match_loop())
 
-    def stop(self) -> None:
-        """Stop the matching thread."""
+    async def stop(self) -> None:
+        """Stop the matching task once the queued products are processed."""
         self._running = False
-        self.product_queue.put(None)  # Sentinel to unblock
+        # Sentinel to unblock; skipped if the task has already finished,
+        # whose error join() then reports
+        await self._put(None)
 
-    def _match_loop(self) -> None:
-        """Main matching loop running in background thread."""
-        batch: List[Dict] = []
+    async def join(self) -> None:
+        """
+        Wait for the matching task to finish the products queued before stop().
 
-        while self._running:
-            try:
-                product = self.product_queue.get(timeout=1.0)
+        Also returns once a cancelled task has stopped; an error raised by
+        the task is re-raised here.
+        """
+        task = getattr(self, '_match_task', None)
+        if task is not None:
+            await asyncio.wait({task})
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+    def cancel(self) -> None:
+        """Stop the matching task immediately, dropping queued products."""
+        self._running = False
+        task = getattr(self, '_match_task', None)
+        if task is not None:
+            task.cancel()
+        self._shutdown_pool()
+
+    def _shutdown_pool(self) -> None:
+        """Release the difflib worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _match_loop(self) -> None:
+        """
+        Main matching loop, running as a task on the pipeline's event loop.
 
-                if product is None:  # Sentinel
+        Scoring is CPU-bound, so each batch is handed to the default
+        executor while the loop keeps serving the crawlers.
+        """
+        loop = asyncio.get_running_loop()
+        batch: List[Dict] = []
+        queue = self.product_queue
+
+        # Load the model while the first batch is still being crawled
+        await loop.run_in_executor(None, self._load_model)
+
+        while True:
+            # Wait only for the first item, then take whatever else is
+            # already queued
+            products = await queue.get()
+
+            while products is not None:  # None is the stop sentinel
+                batch.extend(products)
+                while len(batch) >= self.batch_size:
+                    await self._score_batch(batch[:self.batch_size])
+                    batch = batch[self.batch_size:]
+                try:
+                    products = queue.get_nowait()
+                except asyncio.QueueEmpty:
                     break
+            else:
+                break
 
-                batch.append(product)
+        # Process remaining batch
+        if batch:
+            await self._score_batch(batch)
+        self._shutdown_pool()
 
-                # Process batch when full
-                if len(batch) >= self.batch_size:
-                    self._process_batch(batch)
-                    batch = []
+    async def _score_batch(self, batch: List[Dict]) -> None:
+        """
+        Score a batch on the default executor and report its matches.
 
-            except Empty:
-                # Process partial batch if no new products coming
-                if batch and not self._running:
-                    self._process_batch(batch)
-                    batch = []
-                continue
+        The executor job is shielded: if the task is cancelled mid-batch, the
+        batch is still reported before the cancellation propagates, so it is
+        done by the time join() returns.
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, self._process_batch, batch)
+        try:
+            matches = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            with suppress(Exception):
+                self._report_matches(await future)
+            raise
+        self._report_matches(matches)
 
-        # Process remaining batch
-        if batch:
-            self._process_batch(batch)
+    def _process_batch(self, batch: List[Dict]) -> List[Dict]:
+        """
+        Score a batch of products and return its matches.
 
-    def _process_batch(self, batch: List[Dict]) -> None:
-        """Process a batch of products for matching."""
+        Runs on an executor thread, so it only touches the matcher's Site B
+        state; the matches are reported by _report_matches on the loop.
+        """
         if not self.site_b_products:
             self._logger.warning("No Site B products available for matching")
-            return
+            return []
 
         self._logger.info(f"Processing batch of {len(batch)} products")
 
-        for product_a in batch:
-            best_match, score = self._find_best_match(product_a)
+        if self._load_model() or RAPIDFUZZ_AVAILABLE:
+            results = self._match_batch(batch)
+        else:
+            results = self._difflib_batch(batch)
+
+        # One timestamp for the whole batch, formatted once
+        timestamp = datetime.now().isoformat()
 
+        matches: List[Dict] = []
+        for product_a, (best_match, score) in zip(batch, results):
             if best_match and score >= self.threshold:
-                match_result = {
+                matches.append({
                     "source_url": product_a.get('url', ''),
                     "source_title": product_a.get('title', ''),
                     "source_brand": product_a.get('brand', ''),
@@ -396,49 +1064,145 @@ class IncrementalMatcher:
                     "best_match_title": best_match.get('title', ''),
                     "best_match_brand": best_match.get('brand', ''),
                     "score": score,
-                    "timestamp": datetime.now().isoformat()
-                }
-                self.matches.append(match_result)
+                    "timestamp": timestamp
+                })
+        return matches
 
-                if self.on_match:
-                    self.on_match(match_result)
+    def _report_matches(self, matches: List[Dict]) -> None:
+        """Record a scored batch's matches and run the callbacks on the loop thread."""
+        for match_result in matches:
+            self.match_count += 1
 
-        if self.on_batch_complete:
-            self.on_batch_complete(len(self.matches))
+            if self.on_match:
+                self.on_match(match_result)
 
-    def _find_best_match(self, product_a: Dict) -> Tuple[Optional[Dict], float]:
-        """Find the best match for a product using title similarity."""
-        from difflib import SequenceMatcher
+        if self.on_batch_complete:
+            self.on_batch_complete(self.match_count)
 
-        best_match = None
-        best_score = 0.0
+    def _brand_row(self, product_a: Dict) -> np.ndarray:
+        """
+        Brand bonus of product_a against each distinct Site B brand.
 
-        title_a = product_a.get('title', '').lower()
+        0.1 where the brands contain one another. Substring tests run once
+        per Site A brand and distinct Site B brand; per-product bonuses are
+        then a gather through _b_brand_id.
+        """
         brand_a = product_a.get('brand', '').lower()
+        row = self._brand_rows.get(brand_a)
+        if row is None:
+            row = np.zeros(len(self._brand_ids), dtype=np.float32)
+            if brand_a:
+                for brand_b, brand_id in self._brand_ids.items():
+                    if brand_b and (brand_a in brand_b or brand_b in brand_a):
+                        row[brand_id] = 0.1
+            self._brand_rows[brand_a] = row
+        return row
+
+    def _match_batch(self, batch: List[Dict]) -> List[Tuple[Optional[Dict], float]]:
+        """Find the best match for each product from a batch score matrix."""
+        products_b = self._sync_site_b()
+        n = self._b_synced
+        b_brand_id = self._b_brand_id[:n]
+
+        if self._use_embeddings:
+            # The whole Site A batch goes through the model in one forward pass
+            a_emb = self._encode([p.get('title', '') for p in batch], batch_size=len(batch))
+            if self._index is not None:
+                return self._search_index(batch, a_emb, products_b, b_brand_id)
+
+            # One GEMM scores the whole batch against every Site B product
+            if self.quantize:
+                scores = _int8_scores(
+                    a_emb,
+                    self._products_b_embeddings[:n],
+                    self._b_scales[:n]
+                )
+            else:
+                scores = a_emb @ self._products_b_embeddings[:n].T
+        else:
+            # Title similarity for every pair, computed in C across all cores
+            scores = rf_process.cdist(
+                [p.get('title', '').lower() for p in batch],
+                self._b_titles_lc[:n],
+                scorer=fuzz.ratio,
+                dtype=np.float32,
+                workers=-1
+            )
+            scores /= 100.0
 
-        for product_b in self.site_b_products:
-            title_b = product_b.get('title', '').lower()
-            brand_b = product_b.get('brand', '').lower()
+        brand_rows = np.stack([self._brand_row(product_a) for product_a in batch])
+        scores += brand_rows[:, b_brand_id]
 
-            # Title similarity
-            title_score = SequenceMatcher(None, title_a, title_b).ratio()
+        best_idx = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(batch)), best_idx]
+        return [
+            (products_b[i], min(float(score), 1.0))
+            for i, score in zip(best_idx.tolist(), best_scores.tolist())
+        ]
 
-            # Brand bonus
-            brand_bonus = 0.1 if brand_a and brand_b and (
-                brand_a in brand_b or brand_b in brand_a
-            ) else 0
+    def _search_index(
+        self,
+        batch: List[Dict],
+        a_emb: np.ndarray,
+        products_b: List[Dict],
+        b_brand_id: np.ndarray
+    ) -> List[Tuple[Optional[Dict], float]]:
+        """Re-rank the top_k HNSW candidates of each product with the brand bonus."""
+        k = min(self.top_k, self._index.ntotal)
+        sims, ids = self._index.search(np.ascontiguousarray(a_emb), k)
+
+        results: List[Tuple[Optional[Dict], float]] = []
+        for row, product_a in enumerate(batch):
+            found = ids[row] >= 0
+            candidates = ids[row][found]
+            if not len(candidates):
+                results.append((None, 0.0))
+                continue
+            scores = sims[row][found] + self._brand_row(product_a)[b_brand_id[candidates]]
+            best = int(scores.argmax())
+            results.append((products_b[candidates[best]], min(float(scores[best]), 1.0)))
+        return results
 
-            score = title_score + brand_bonus
+    def _difflib_batch(self, batch: List[Dict]) -> List[Tuple[Optional[Dict], float]]:
+        """
+        Find the best match for each product with difflib.
 
-            if score > best_score:
-                best_score = score
-                best_match = product_b
+        Once Site B is final, large batches are split across a process pool
+        whose workers hold Site B, so each task only ships the batch's titles
+        and brands. While Site B is still growing batches are scored here,
+        rather than re-pickling all of Site B into a new pool every batch.
+        """
+        products_b = self._sync_site_b()
+        queries = [
+            (p.get('title', '').lower(), p.get('brand', '').lower())
+            for p in batch
+        ]
 
-        return best_match, min(best_score, 1.0)
+        use_pool = (
+            self._b_final
+            and _CPU_COUNT > 1
+            and len(batch) > 1
+            and len(batch) * self._b_synced >= _POOL_MIN_PAIRS
+        )
+        if use_pool:
+            if self._pool is None or self._pool_synced != self._b_synced:
+                self._shutdown_pool()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=_CPU_COUNT,
+                    initializer=_init_difflib_worker,
+                    initargs=(self._b_titles_lc, self._b_brands_lc, self._b_postings)
+                )
+                self._pool_synced = self._b_synced
+            size = -(-len(queries) // _CPU_COUNT)
+            chunks = [queries[i:i + size] for i in range(0, len(queries), size)]
+            found = [r for chunk in self._pool.map(_difflib_best_matches, chunks) for r in chunk]
+        else:
+            found = [
+                _difflib_best_match(title_a, brand_a, self._b_titles_lc, self._b_brands_lc, self._b_postings)
+                for title_a, brand_a in queries
+            ]
 
-    def get_matches(self) -> List[Dict]:
-        """Get all matches found so far."""
-        return self.matches.copy()
+        return [(products_b[idx] if idx >= 0 else None, score) for idx, score in found]
 
 
 # ============================================================================
@@ -498,28 +1262,52 @@ class PipelineRunner:
         self.logger = setup_logging(config.output_dir)
         self.tracker: Optional[ProgressTracker] = None
 
+        # Per-site product files: (data/<site>.csv, output products_<site>.csv)
+        self._site_files: Dict[str, Tuple[Path, Path]] = {
+            site: (Path("data") / f"{site}.csv", config.output_dir / f"products_{site}.csv")
+            for site in (config.site_a, config.site_b) if site
+        }
+
         # Product storage
         self.site_a_products: List[Dict] = []
         self.site_b_products: List[Dict] = []
-        self.matches: List[Dict] = []
+
+        # Matches are appended to matches.csv as they are found instead of
+        # being kept in memory
+        self._matches_fp = None
+        self._matches_writer = None
+        self._matches_streamed = 0
+        self._a_queued = 0  # Site A products handed to the incremental matcher
 
         # Checkpoint state
         self.checkpoint = CrawlCheckpoint(timestamp=datetime.now().isoformat())
+        self._checkpoint_store = CheckpointStore(config.checkpoint_dir / "crawl_state.json")
+        # Intermediate checkpoints are written by a background thread so the
+        # product CSVs are not serialized on the event loop
+        self._checkpoint_queue: Queue = Queue()
+        self._checkpoint_thread: Optional[threading.Thread] = None
 
         # Control flags
         self._running = False
         self._paused = False
         self._cancelled = False
 
-        # Rich console for pretty output
-        if RICH_AVAILABLE:
-            self.console = Console()
+        # Per-site fetch limits: (concurrency semaphore, requests/min bucket)
+        self._site_limits: Dict[str, Tuple[asyncio.BoundedSemaphore, RateLimiter]] = {}
+
+        # Rich console for the startup header, created on first use
+        self.console = None
 
         self.logger.info(f"Pipeline initialized. Output: {config.output_dir}")
 
     def _print_header(self) -> None:
         """Print pipeline startup header."""
-        if RICH_AVAILABLE:
+        # Rich markup is only worth rendering on a terminal; when stdout is
+        # piped the plain header is printed instead
+        if RICH_AVAILABLE and sys.stdout.isatty():
+            if self.console is None:
+                self.console = Console()
+
             header = Text()
             header.append("URL-to-URL Product Matching Pipeline\n", style="bold blue")
             header.append(f"Sites: {self.config.site_a} -> {self.config.site_b}\n")
@@ -543,29 +1331,113 @@ class PipelineRunner:
             print("-" * 60)
 
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        def handle_interrupt(signum, frame):
+        """
+        Setup signal handlers for graceful shutdown.
+
+        The handlers run on the event loop and cancel the running pipeline
+        task, so an interrupt takes effect at the next await instead of
+        waiting for the crawl loops to poll _cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        main_task = asyncio.current_task()
+
+        def handle_interrupt():
             self.logger.warning("Interrupt received, saving checkpoint...")
             self._cancelled = True
             self._save_checkpoint()
+            main_task.cancel()
 
-        signal.signal(signal.SIGINT, handle_interrupt)
-        signal.signal(signal.SIGTERM, handle_interrupt)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, handle_interrupt)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops have no add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(handle_interrupt))
+
+    def _remove_signal_handlers(self) -> None:
+        """Remove the event loop signal handlers installed by run()."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(sig)
+            except (NotImplementedError, RuntimeError):
+                signal.signal(sig, signal.default_int_handler if sig == signal.SIGINT else signal.SIG_DFL)
+
+    def _save_checkpoint(self, final: bool = False) -> None:
+        """
+        Save current state to checkpoint file.
 
-    def _save_checkpoint(self) -> None:
-        """Save current state to checkpoint file."""
+        Args:
+            final: Compact the change log into crawl_state.json
+        """
         self.checkpoint.timestamp = datetime.now().isoformat()
         self.checkpoint.site_a_products = len(self.site_a_products)
         self.checkpoint.site_b_products = len(self.site_b_products)
 
-        checkpoint_file = self.config.checkpoint_dir / "crawl_state.json"
+        # Snapshot now; the lists keep growing while the write is pending
+        snapshot = (
+            CrawlCheckpoint(**asdict(self.checkpoint)),
+            self.site_a_products.copy(),
+            self.site_b_products.copy()
+        )
+
+        if final:
+            # Let queued saves land first, then write inline
+            if not self._stop_checkpoint_writer():
+                # Writing now would race the writer on the checkpoint files
+                self.logger.warning("Checkpoint writer did not stop in time, skipping final checkpoint")
+                return
+            self._write_checkpoint(*snapshot, final=True)
+            return
+
+        if self._checkpoint_thread is None:
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_worker,
+                name="checkpoint-writer",
+                daemon=True
+            )
+            self._checkpoint_thread.start()
+        self._checkpoint_queue.put(snapshot)
+
+    def _checkpoint_worker(self) -> None:
+        """Write queued checkpoint snapshots until the None sentinel."""
+        while True:
+            snapshot = self._checkpoint_queue.get()
+            if snapshot is None:
+                break
+            self._write_checkpoint(*snapshot)
+
+    def _stop_checkpoint_writer(self, timeout: float = 30.0) -> bool:
+        """
+        Flush pending checkpoint writes and stop the writer thread.
+
+        Returns:
+            False if the writer is still busy after the timeout
+        """
+        if self._checkpoint_thread is None:
+            return True
+        self._checkpoint_queue.put(None)
+        self._checkpoint_thread.join(timeout=timeout)
+        if self._checkpoint_thread.is_alive():
+            return False
+        self._checkpoint_thread = None
+        return True
+
+    def _write_checkpoint(
+        self,
+        checkpoint: CrawlCheckpoint,
+        site_a_products: List[Dict],
+        site_b_products: List[Dict],
+        final: bool = False
+    ) -> None:
+        """Persist a checkpoint snapshot and its product CSVs."""
+        checkpoint_file = self._checkpoint_store.snapshot_path
 
         try:
-            with open(checkpoint_file, 'w') as f:
-                json.dump(asdict(self.checkpoint), f, indent=2)
+            self._checkpoint_store.save(checkpoint, compact=final)
 
             # Also save current product data
-            self._save_products_csv()
+            self._save_products_csv(site_a_products, site_b_products)
 
             self.logger.info(f"Checkpoint saved to {checkpoint_file}")
         except Exception as e:
@@ -574,8 +1446,9 @@ class PipelineRunner:
     def _load_checkpoint(self, checkpoint_file: Path) -> bool:
         """Load state from checkpoint file."""
         try:
-            with open(checkpoint_file) as f:
-                data = json.load(f)
+            data = CheckpointStore(checkpoint_file).load()
+            if data is None:
+                raise FileNotFoundError(checkpoint_file)
 
             self.checkpoint = CrawlCheckpoint(**data)
             self.logger.info(f"Loaded checkpoint from {checkpoint_file}")
@@ -593,13 +1466,13 @@ class PipelineRunner:
     def _load_existing_products(self) -> None:
         """Load existing product data from CSV files."""
         # Site A
-        site_a_file = self.config.output_dir / f"products_{self.config.site_a}.csv"
+        site_a_file = self._site_files[self.config.site_a][1]
         if site_a_file.exists():
             self.site_a_products = self._load_csv(site_a_file)
             self.logger.info(f"Loaded {len(self.site_a_products)} Site A products")
 
         # Site B
-        site_b_file = self.config.output_dir / f"products_{self.config.site_b}.csv"
+        site_b_file = self._site_files[self.config.site_b][1]
         if site_b_file.exists():
             self.site_b_products = self._load_csv(site_b_file)
             self.logger.info(f"Loaded {len(self.site_b_products)} Site B products")
@@ -608,24 +1481,39 @@ class PipelineRunner:
         """Load products from CSV file."""
         products = []
         try:
-            with open(file_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                products = list(reader)
+            if POLARS_AVAILABLE:
+                # All columns as strings, empty cells as '' like DictReader
+                return pl.read_csv(file_path, infer_schema_length=0).fill_null('').to_dicts()
+            if file_path.stat().st_size < _READ_WHOLE_LIMIT:
+                data = file_path.read_bytes().decode('utf-8')
+                products = list(csv.DictReader(io.StringIO(data, newline='')))
+            else:
+                with open(file_path, newline='', encoding='utf-8') as f:
+                    products = list(csv.DictReader(f))
         except Exception as e:
             self.logger.error(f"Failed to load {file_path}: {e}")
         return products
 
-    def _save_products_csv(self) -> None:
-        """Save current products to CSV files."""
+    def _save_products_csv(
+        self,
+        site_a_products: Optional[List[Dict]] = None,
+        site_b_products: Optional[List[Dict]] = None
+    ) -> None:
+        """Save products (the current ones by default) to CSV files."""
+        if site_a_products is None:
+            site_a_products = self.site_a_products
+        if site_b_products is None:
+            site_b_products = self.site_b_products
+
         # Site A
-        if self.site_a_products:
-            site_a_file = self.config.output_dir / f"products_{self.config.site_a}.csv"
-            self._save_csv(self.site_a_products, site_a_file)
+        if site_a_products:
+            site_a_file = self._site_files[self.config.site_a][1]
+            self._save_csv(site_a_products, site_a_file)
 
         # Site B
-        if self.site_b_products:
-            site_b_file = self.config.output_dir / f"products_{self.config.site_b}.csv"
-            self._save_csv(self.site_b_products, site_b_file)
+        if site_b_products:
+            site_b_file = self._site_files[self.config.site_b][1]
+            self._save_csv(site_b_products, site_b_file)
 
     def _save_csv(self, products: List[Dict], file_path: Path) -> None:
         """Save products to CSV file."""
@@ -633,11 +1521,7 @@ class PipelineRunner:
             return
 
         try:
-            fieldnames = ['url', 'title', 'brand', 'category', 'price']
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(products)
+            _write_csv(file_path, PRODUCT_FIELDNAMES, products)
             self.logger.debug(f"Saved {len(products)} products to {file_path}")
         except Exception as e:
             self.logger.error(f"Failed to save {file_path}: {e}")
@@ -678,22 +1562,28 @@ class PipelineRunner:
                 self._load_checkpoint(self.config.resume_from)
 
             # Execute appropriate mode
-            if self.config.match_only:
-                # Match only mode
-                await self._run_match_only()
-            elif self.config.crawl_only:
-                # Crawl only mode
-                await self._run_crawl_only()
-            else:
-                # Full pipeline: crawl + match
-                await self._run_full_pipeline()
+            try:
+                if self.config.match_only:
+                    # Match only mode
+                    await self._run_match_only()
+                elif self.config.crawl_only:
+                    # Crawl only mode
+                    await self._run_crawl_only()
+                else:
+                    # Full pipeline: crawl + match
+                    await self._run_full_pipeline()
+            except asyncio.CancelledError:
+                if not self._cancelled:
+                    raise
+                # Interrupted by a signal: finish with what was collected
+                self.logger.warning("Pipeline interrupted")
 
             # Complete tracking
             summary = self.tracker.complete() if self.tracker else {}
 
             # Save final checkpoint
             self.checkpoint.status = "completed" if not self._cancelled else "interrupted"
-            self._save_checkpoint()
+            self._save_checkpoint(final=True)
 
             elapsed = time.time() - start_time
 
@@ -702,16 +1592,18 @@ class PipelineRunner:
                 "elapsed_seconds": round(elapsed, 2),
                 "site_a_products": len(self.site_a_products),
                 "site_b_products": len(self.site_b_products),
-                "matches": len(self.matches),
+                "matches": self._matches_streamed,
                 "output_dir": str(self.config.output_dir),
                 **summary
             }
 
         except Exception as e:
             self.logger.error(f"Pipeline failed: {e}")
-            self._save_checkpoint()
+            self._save_checkpoint(final=True)
             raise
         finally:
+            self._close_match_stream()
+            self._remove_signal_handlers()
             self._running = False
 
     async def _run_crawl_only(self) -> None:
@@ -770,7 +1662,7 @@ class PipelineRunner:
         1. Start Site B crawl first (background) - larger dataset
         2. Start Site A crawl (parallel) - smaller dataset
         3. As Site A products arrive, queue them for incremental matching
-        4. Matching runs in background thread, processes every 10 products
+        4. Matching runs as a background task, processes every 10 products
         5. Once both crawls complete, finalize matching and generate report
         """
         self.logger.info("Running FULL PIPELINE (Parallel Crawl + Incremental Match)")
@@ -784,16 +1676,22 @@ class PipelineRunner:
         matcher = IncrementalMatcher(
             batch_size=10,
             threshold=self.config.threshold,
-            model_name=self.config.model
+            model_name=self.config.model,
+            cache_dir=self.config.output_dir / ".cache",
+            quantize=self.config.quantize_embeddings,
+            top_k=self.config.top_k,
+            ann_index=self.config.ann_index,
+            hnsw_m=self.config.hnsw_m,
+            hnsw_ef_search=self.config.hnsw_ef_search
         )
 
         # Callbacks for matcher
         def on_match(match_result: Dict):
             display.update(
-                match_count=len(matcher.matches),
+                match_count=matcher.match_count,
                 last_match=match_result
             )
-            self.matches.append(match_result)
+            self._stream_match(match_result)
 
         def on_batch_complete(total_matches: int):
             self.logger.info(f"Batch complete: {total_matches} total matches")
@@ -801,16 +1699,26 @@ class PipelineRunner:
         matcher.on_match = on_match
         matcher.on_batch_complete = on_batch_complete
 
-        # Callbacks for Site A crawl - queue products for incremental matching
+        # Callbacks for Site A crawl - queue products for incremental matching,
+        # one matcher batch at a time. site_a_products[:self._a_queued] have
+        # been handed to the matcher (or are in pending_a).
+        pending_a: List[Dict] = []
+        self._a_queued = 0
+
         async def on_product_a(product: Dict):
             self.site_a_products.append(product)
             display.update(
                 site_a_count=len(self.site_a_products),
                 product_a=product.get('title', '')
             )
-            # Queue for incremental matching once Site B has some products
+            # Queue for incremental matching once Site B has some products,
+            # including any Site A products that arrived before that
             if len(self.site_b_products) >= 50:
-                matcher.queue_product(product)
+                pending_a.extend(islice(self.site_a_products, self._a_queued, None))
+                self._a_queued = len(self.site_a_products)
+                if len(pending_a) >= matcher.batch_size:
+                    await matcher.queue_products(pending_a)
+                    pending_a.clear()
 
         # Callbacks for Site B crawl
         async def on_product_b(product: Dict):
@@ -819,13 +1727,15 @@ class PipelineRunner:
                 site_b_count=len(self.site_b_products),
                 product_b=product.get('title', '')
             )
-            # Update matcher's target products periodically
+            # Update matcher's target products periodically; the list only
+            # grows, so the matcher can share it instead of a copy
             if len(self.site_b_products) % 50 == 0:
-                matcher.set_site_b_products(self.site_b_products.copy())
+                matcher.set_site_b_products(self.site_b_products)
 
         try:
             # Stage 1: Initialize
             display.update(stage="Stage 1: Initializing")
+            self._open_match_stream()
             self.tracker.start_crawl(self.config.site_a, self.config.target_products_a)
             self.tracker.start_crawl(self.config.site_b, self.config.target_products_b)
 
@@ -833,26 +1743,18 @@ class PipelineRunner:
             display.update(stage="Stage 2: Parallel Crawling")
             self.logger.info("Starting parallel crawl of both sites...")
 
-            # Create crawl tasks
-            crawl_a = self._crawl_site(
-                site_name=self.config.site_a,
-                target=self.config.target_products_a,
-                on_product=on_product_a,
-                display=display
-            )
-
-            crawl_b = self._crawl_site(
-                site_name=self.config.site_b,
-                target=self.config.target_products_b,
-                on_product=on_product_b,
-                display=display
-            )
-
-            # Start matcher thread
+            # Start matcher task
             matcher.start()
 
-            # Run crawls in parallel using asyncio.gather
-            await asyncio.gather(crawl_a, crawl_b)
+            # Run crawls in parallel, at most max_concurrent_sites at a time
+            sites = (
+                (self.config.site_a, self.config.target_products_a, on_product_a),
+                (self.config.site_b, self.config.target_products_b, on_product_b),
+            )
+            site_slots = asyncio.Semaphore(max(1, self.config.max_concurrent_sites))
+            async with asyncio.TaskGroup() as tg:
+                for site_name, target, on_product in sites:
+                    tg.create_task(self._bounded_crawl(site_slots, site_name, target, on_product, display))
 
             self.logger.info(f"Parallel crawl complete: Site A={len(self.site_a_products)}, Site B={len(self.site_b_products)}")
 
@@ -860,28 +1762,37 @@ class PipelineRunner:
             display.update(stage="Stage 3: Finalizing Matches")
 
             # Set final Site B products and queue remaining Site A products
-            matcher.set_site_b_products(self.site_b_products.copy())
-
-            # Queue any Site A products that weren't matched during crawl
-            queued_count = matcher.product_queue.qsize()
-            for product in self.site_a_products[queued_count:]:
-                if self._cancelled:
+            matcher.set_site_b_products(self.site_b_products, final=True)
+            await matcher.queue_products(pending_a)
+            pending_a.clear()
+
+            # Queue any Site A products that weren't queued during the crawl
+            remaining = islice(self.site_a_products, self._a_queued, None)
+            while not self._cancelled:
+                chunk = list(islice(remaining, matcher.batch_size))
+                if not chunk:
                     break
-                matcher.queue_product(product)
+                await matcher.queue_products(chunk)
+                self._a_queued += len(chunk)
 
             # Wait for matching to complete
-            matcher.stop()
-            await asyncio.sleep(2)  # Give time for final batch
+            await matcher.stop()
+            try:
+                await asyncio.wait_for(matcher.join(), timeout=30)
+            except TimeoutError:
+                self.logger.warning("Matching did not finish within 30s, stopping it")
+                matcher.cancel()
+                await matcher.join()
 
-            # Get all matches
-            self.matches = matcher.get_matches()
+            # All matches are on disk now
+            self._close_match_stream()
 
             # Update tracker
             self.tracker.complete_crawl(self.config.site_a, len(self.site_a_products))
             self.tracker.complete_crawl(self.config.site_b, len(self.site_b_products))
 
             # Stage 4: Generate Report
-            if not self._cancelled and self.matches:
+            if not self._cancelled and self._matches_streamed:
                 display.update(stage="Stage 4: Generating Report")
                 await self._generate_report()
 
@@ -889,8 +1800,55 @@ class PipelineRunner:
             display.update(stage="Stage 5: Complete")
 
         finally:
+            # Stop matching (a no-op once it has finished) and wait for the
+            # batch in flight to report before matches.csv is closed
+            matcher.cancel()
+            with suppress(Exception):
+                await matcher.join()
+            self._close_match_stream()
             display.stop()
 
+    def _open_match_stream(self) -> None:
+        """Start matches.csv so matches can be appended as they are found."""
+        matches_file = self.config.output_dir / "matches.csv"
+        self._matches_fp = open(matches_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER)
+        self._matches_writer = csv.writer(self._matches_fp)
+        self._matches_writer.writerow(MATCH_FIELDNAMES)
+        self._matches_streamed = 0
+
+    def _stream_match(self, match_result: Dict) -> None:
+        """Append one match to matches.csv."""
+        self._matches_writer.writerow([match_result.get(name, '') for name in MATCH_FIELDNAMES])
+        self._matches_streamed += 1
+        if self._matches_streamed % 100 == 0:
+            self._matches_fp.flush()
+
+    def _close_match_stream(self) -> None:
+        """Flush and close matches.csv, if it is open."""
+        if self._matches_fp is not None:
+            self._matches_fp.close()
+            self._matches_fp = None
+            self._matches_writer = None
+
+    @asynccontextmanager
+    async def _fetch_slot(self, site_name: str):
+        """
+        Hold one of the site's parallel_browsers slots for a page fetch,
+        after taking a token from its rate_limit bucket.
+        """
+        limits = self._site_limits.get(site_name)
+        if limits is None:
+            limits = (
+                asyncio.BoundedSemaphore(self.config.parallel_browsers),
+                RateLimiter(self.config.rate_limit, 60.0)
+            )
+            self._site_limits[site_name] = limits
+
+        semaphore, limiter = limits
+        async with semaphore:
+            await limiter.acquire()
+            yield
+
     async def _crawl_site(
         self,
         site_name: str,
@@ -906,89 +1864,132 @@ class PipelineRunner:
         """
         self.logger.info(f"Starting crawl for {site_name} (target: {target})")
 
-        # First check for existing data
-        data_file = Path("data") / f"{site_name}.csv"
-        output_file = self.config.output_dir / f"products_{site_name}.csv"
+        count = await self._feed_products(site_name, target, on_product)
+        self.logger.info(f"Loaded {count} products for {site_name}")
 
-        source_file = None
-        if data_file.exists():
-            source_file = data_file
-        elif output_file.exists():
-            source_file = output_file
+    async def _bounded_crawl(
+        self,
+        site_slots: asyncio.Semaphore,
+        site_name: str,
+        target: int,
+        on_product: Callable,
+        display: LiveDisplay
+    ) -> None:
+        """Crawl a site once one of the concurrent site slots is free."""
+        async with site_slots:
+            await self._crawl_site(site_name, target, on_product, display)
 
-        if source_file:
-            self.logger.info(f"Loading existing data from {source_file}")
-            products = self._load_csv(source_file)
+    async def _iter_products(
+        self,
+        site_name: str,
+        target: int,
+        prefer_output: bool = False
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield up to target products for a site.
 
-            for i, product in enumerate(products[:target]):
-                if self._cancelled:
-                    break
+        Products come from data/<site>.csv or the output directory's
+        products_<site>.csv (checked first with prefer_output), else demo
+        products are generated one page of 20 at a time. Demo pages only go
+        through the site's fetch limits when simulate_delay is set, since
+        no page is actually fetched.
+        """
+        data_file, output_file = self._site_files[site_name]
+        candidates = (output_file, data_file) if prefer_output else (data_file, output_file)
 
-                await on_product(product)
+        for source_file in candidates:
+            if not source_file.exists():
+                continue
+            products = self._load_csv(source_file)
+            if products:
+                self.logger.info(f"Loading existing data from {source_file}")
+                for product in islice(products, target):
+                    yield product
+                return
 
-                # Update tracker
-                self.tracker.update_crawl(
-                    site_name,
-                    products_found=i + 1,
-                    current_page=(i // 20) + 1,
-                    last_product=product
-                )
+        # No existing data - generate mock data for demo
+        self.logger.warning(f"No existing data for {site_name}, generating demo data")
+        url_prefix = f"https://www.{site_name}.com/product/"
+        title_prefix = f"Sample {site_name.title()} Product "
+        brands = cycle([f"Brand{b}" for b in range(10)])
+        categories = cycle(self.config.categories)
+
+        for i, brand, category in zip(range(target), brands, categories):
+            # Each page of 20 demo products stands in for one page request
+            if self.config.simulate_delay and i % 20 == 0:
+                async with self._fetch_slot(site_name):
+                    pass
+
+            n = str(i + 1)
+            yield {
+                "url": url_prefix + n,
+                "title": title_prefix + n,
+                "brand": brand,
+                "category": category,
+                "price": "Rs. " + str(100 + i * 10)
+            }
 
-                # Simulate crawl timing for realistic progress
-                await asyncio.sleep(0.05)
+    async def _feed_products(
+        self,
+        site_name: str,
+        target: int,
+        on_product: Callable,
+        prefer_output: bool = False
+    ) -> int:
+        """
+        Pass a site's products to on_product and report crawl progress.
 
-            self.logger.info(f"Loaded {min(len(products), target)} products for {site_name}")
-            return
+        The tracker is updated every _PROGRESS_EVERY products and after the
+        last one, yielding to the event loop each time. Products come from
+        memory, so they are only paced when simulate_delay is set.
 
-        # No existing data - generate mock data for demo
-        self.logger.warning(f"No existing data for {site_name}, generating demo data")
-        for i in range(target):
+        Returns:
+            Number of products delivered
+        """
+        count = 0
+        product = None
+
+        async for product in self._iter_products(site_name, target, prefer_output):
             if self._cancelled:
                 break
 
-            product = {
-                "url": f"https://www.{site_name}.com/product/{i+1}",
-                "title": f"Sample {site_name.title()} Product {i+1}",
-                "brand": f"Brand{i % 10}",
-                "category": self.config.categories[i % len(self.config.categories)],
-                "price": f"Rs. {100 + i * 10}"
-            }
-
             await on_product(product)
+            count += 1
 
+            if count % _PROGRESS_EVERY == 0:
+                self.tracker.update_crawl(
+                    site_name,
+                    products_found=count,
+                    current_page=(count - 1) // 20 + 1,
+                    last_product=product
+                )
+                await asyncio.sleep(0)
+
+            # Simulate crawl timing for realistic progress
+            if self.config.simulate_delay:
+                await asyncio.sleep(0.05)
+
+        if count % _PROGRESS_EVERY:
             self.tracker.update_crawl(
                 site_name,
-                products_found=i + 1,
-                current_page=(i // 20) + 1,
+                products_found=count,
+                current_page=(count - 1) // 20 + 1,
                 last_product=product
             )
-
-            await asyncio.sleep(0.05)
+        return count
 
     async def _generate_report(self) -> None:
         """Generate HTML report from matches."""
-        if not self.matches:
-            self.logger.info("No matches to report")
-            return
-
-        # Save matches to CSV first
         matches_file = self.config.output_dir / "matches.csv"
-        fieldnames = [
-            'source_url', 'source_title', 'source_brand',
-            'best_match_url', 'best_match_title', 'best_match_brand',
-            'score', 'timestamp'
-        ]
 
-        try:
-            with open(matches_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(self.matches)
-            self.logger.info(f"Saved {len(self.matches)} matches to {matches_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save matches: {e}")
+        if not self._matches_streamed:
+            self.logger.info("No matches to report")
             return
 
+        # Already written match by match
+        self._close_match_stream()
+        self.logger.info(f"Saved {self._matches_streamed} matches to {matches_file}")
+
         # Try to generate HTML report
         try:
             from generate_report import generate_report
@@ -1019,75 +2020,13 @@ class PipelineRunner:
         Simulate crawling (placeholder for actual MCP crawler integration).
 
         In production, this would use PlaywrightCrawler with MCP tools.
-        For now, it loads from existing CSV or generates mock data.
+        For now, it loads from existing CSV (previous output first) or
+        generates mock data.
         """
-        # Try to load from existing data first
-        existing_file = self.config.output_dir / f"products_{site_name}.csv"
-        if existing_file.exists():
-            loaded = self._load_csv(existing_file)
-            if loaded:
-                products_list.extend(loaded[:target])
-
-                # Update progress
-                for i, product in enumerate(products_list):
-                    if self._cancelled:
-                        break
-                    self.tracker.update_crawl(
-                        site_name,
-                        products_found=i + 1,
-                        current_page=(i // 20) + 1,
-                        last_product=product
-                    )
-                    await asyncio.sleep(0.01)  # Small delay for UI updates
-
-                return
-
-        # Also check data/ directory
-        data_file = Path("data") / f"{site_name}.csv"
-        if data_file.exists():
-            loaded = self._load_csv(data_file)
-            if loaded:
-                products_list.extend(loaded[:target])
-
-                for i, product in enumerate(products_list):
-                    if self._cancelled:
-                        break
-                    self.tracker.update_crawl(
-                        site_name,
-                        products_found=i + 1,
-                        current_page=(i // 20) + 1,
-                        last_product=product
-                    )
-                    await asyncio.sleep(0.01)
-
-                return
-
-        # Generate mock data if no existing data
-        self.logger.warning(f"No existing data for {site_name}, generating mock data")
-
-        for i in range(target):
-            if self._cancelled:
-                break
-
-            product = {
-                "url": f"https://www.{site_name}.com/product/{i+1}",
-                "title": f"Sample Product {i+1} from {site_name}",
-                "brand": f"Brand{i % 10}",
-                "category": self.config.categories[i % len(self.config.categories)],
-                "price": f"Rs. {100 + i * 10}"
-            }
+        async def collect(product: Dict) -> None:
             products_list.append(product)
 
-            # Update progress
-            self.tracker.update_crawl(
-                site_name,
-                products_found=i + 1,
-                current_page=(i // 20) + 1,
-                last_product=product
-            )
-
-            # Simulate crawl delay
-            await asyncio.sleep(0.05)
+        await self._feed_products(site_name, target, collect, prefer_output=True)
 
     async def _run_matching(self) -> None:
         """Run the semantic matching engine."""
@@ -1101,124 +2040,150 @@ class PipelineRunner:
             source_count=len(self.site_a_products),
             target_count=len(self.site_b_products)
         )
+        self._open_match_stream()
 
-        # Import matching engine
+        loop = asyncio.get_running_loop()
         try:
-            from url_mapper import SemanticMatcher
+            model = await loop.run_in_executor(None, _get_model, self.config.model)
+        except Exception as e:
+            self.logger.warning(f"Embedding model not available: {e}")
+            self.logger.info("Running simple title-based matching instead...")
 
-            # Initialize matcher
-            matcher = SemanticMatcher(model_name=self.config.model)
+            # Simple fallback matching
+            await self._simple_matching()
+            return
 
-            # Convert to DataFrames
-            import pandas as pd
-            df_a = pd.DataFrame(self.site_a_products)
-            df_b = pd.DataFrame(self.site_b_products)
+        # Both sites are encoded in batched calls off the event loop
+        encode = partial(
+            model.encode,
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        emb_a = await loop.run_in_executor(None, encode, [p.get('title', '') for p in self.site_a_products])
+        emb_b = await loop.run_in_executor(None, encode, [p.get('title', '') for p in self.site_b_products])
+        emb_a = emb_a.astype(np.float32, copy=False)
+        emb_b_t = np.ascontiguousarray(emb_b.astype(np.float32, copy=False).T)
+
+        # Cosine similarity is one GEMM per chunk of Site A rows
+        chunk_size = 1024
+        for start in range(0, len(self.site_a_products), chunk_size):
+            if self._cancelled:
+                break
 
-            # Load products
-            products_a = matcher.load_products(df_a, "Site A")
-            products_b = matcher.load_products(df_b, "Site B")
+            scores = await loop.run_in_executor(None, np.matmul, emb_a[start:start + chunk_size], emb_b_t)
+            best_idx = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(best_idx)), best_idx]
 
-            # Find matches with progress updates
-            for i, product_a in enumerate(products_a):
-                if self._cancelled:
-                    break
+            chunk = self.site_a_products[start:start + chunk_size]
+            for offset, (product_a, j, best_score) in enumerate(
+                zip(chunk, best_idx.tolist(), best_scores.tolist())
+            ):
+                self._record_match(start + offset, product_a, self.site_b_products[j], min(best_score, 1.0))
 
-                # Find best match
-                best_match, score = matcher.find_best_match(product_a, products_b)
-
-                if best_match:
-                    match_result = {
-                        "source_url": product_a.url,
-                        "source_title": product_a.title,
-                        "best_match_url": best_match.url,
-                        "best_match_title": best_match.title,
-                        "score": score
-                    }
-                    self.matches.append(match_result)
-
-                    # Update progress
-                    self.tracker.update_matching(
-                        matched=i + 1,
-                        current_product=product_a.title[:50],
-                        best_match=best_match.title[:50] if best_match else None,
-                        score=score
-                    )
-
-                await asyncio.sleep(0.01)  # Allow UI updates
-
-            # Save matches
-            matches_file = self.config.output_dir / "matches.csv"
-            self._save_csv(self.matches, matches_file)
-            self.logger.info(f"Saved {len(self.matches)} matches to {matches_file}")
-
-        except ImportError as e:
-            self.logger.warning(f"SemanticMatcher not available: {e}")
-            self.logger.info("Running simple title-based matching instead...")
-
-            # Simple fallback matching
-            await self._simple_matching()
+        self._finish_match_stream()
 
     async def _simple_matching(self) -> None:
-        """Simple title-based matching fallback."""
-        from difflib import SequenceMatcher
+        """
+        Simple title-based matching fallback.
 
-        for i, product_a in enumerate(self.site_a_products):
-            if self._cancelled:
-                break
+        With RapidFuzz, Site A is scored against all of Site B in chunks of
+        rows, each chunk as one multi-core cdist call on the default
+        executor. Otherwise every pair goes through difflib.
+        """
+        # Site B titles are lowercased once, not once per Site A product
+        titles_b = [p.get('title', '').lower() for p in self.site_b_products]
+
+        if RAPIDFUZZ_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            chunk_size = 256
+
+            for start in range(0, len(self.site_a_products), chunk_size):
+                if self._cancelled:
+                    break
 
-            best_match = None
-            best_score = 0.0
+                chunk = self.site_a_products[start:start + chunk_size]
+                scores = await loop.run_in_executor(None, partial(
+                    rf_process.cdist,
+                    [p.get('title', '').lower() for p in chunk],
+                    titles_b,
+                    scorer=fuzz.ratio,
+                    dtype=np.float32,
+                    workers=-1
+                ))
+                best_idx = scores.argmax(axis=1)
+                best_scores = scores[np.arange(len(chunk)), best_idx] / 100.0
+
+                for offset, (product_a, j, best_score) in enumerate(
+                    zip(chunk, best_idx.tolist(), best_scores.tolist())
+                ):
+                    best_match = self.site_b_products[j] if best_score > 0 else None
+                    self._record_match(start + offset, product_a, best_match, best_score)
+        else:
+            for i, product_a in enumerate(self.site_a_products):
+                if self._cancelled:
+                    break
 
-            title_a = product_a.get('title', '').lower()
+                best_match = None
+                best_score = 0.0
 
-            for product_b in self.site_b_products:
-                title_b = product_b.get('title', '').lower()
-                score = SequenceMatcher(None, title_a, title_b).ratio()
+                matcher = SequenceMatcher(None, b=product_a.get('title', '').lower())
 
-                if score > best_score:
-                    best_score = score
-                    best_match = product_b
+                for idx, title_b in enumerate(titles_b):
+                    matcher.set_seq1(title_b)
+                    score = matcher.ratio()
 
-            if best_match and best_score > self.config.threshold:
-                match_result = {
-                    "source_url": product_a.get('url', ''),
-                    "source_title": product_a.get('title', ''),
-                    "best_match_url": best_match.get('url', ''),
-                    "best_match_title": best_match.get('title', ''),
-                    "score": best_score
-                }
-                self.matches.append(match_result)
-
-            # Update progress
-            self.tracker.update_matching(
-                matched=i + 1,
-                current_product=product_a.get('title', '')[:50],
-                best_match=best_match.get('title', '')[:50] if best_match else None,
-                score=best_score
-            )
+                    if score > best_score:
+                        best_score = score
+                        best_match = self.site_b_products[idx]
+
+                self._record_match(i, product_a, best_match, best_score)
+
+                await asyncio.sleep(0.01)
 
-            await asyncio.sleep(0.01)
+        self._finish_match_stream()
 
-        # Save matches
+    def _finish_match_stream(self) -> None:
+        """Close matches.csv once matching is done and log the total."""
+        self._close_match_stream()
         matches_file = self.config.output_dir / "matches.csv"
-        if self.matches:
-            fieldnames = ['source_url', 'source_title', 'best_match_url', 'best_match_title', 'score']
-            try:
-                with open(matches_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.matches)
-                self.logger.info(f"Saved {len(self.matches)} matches to {matches_file}")
-            except Exception as e:
-                self.logger.error(f"Failed to save matches: {e}")
+        self.logger.info(f"Saved {self._matches_streamed} matches to {matches_file}")
+
+    def _record_match(
+        self,
+        index: int,
+        product_a: Dict,
+        best_match: Optional[Dict],
+        best_score: float
+    ) -> None:
+        """Keep a match result above the threshold and report progress."""
+        if best_match and best_score > self.config.threshold:
+            match_result = {
+                "source_url": product_a.get('url', ''),
+                "source_title": product_a.get('title', ''),
+                "best_match_url": best_match.get('url', ''),
+                "best_match_title": best_match.get('title', ''),
+                "score": best_score
+            }
+            self._stream_match(match_result)
+
+        # Update progress
+        self.tracker.update_matching(
+            matched=index + 1,
+            current_product=product_a.get('title', '')[:50],
+            best_match=best_match.get('title', '')[:50] if best_match else None,
+            score=best_score
+        )
 
 
 # ============================================================================
 # CLI Interface
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser for CLI."""
+    """Create argument parser for CLI (built once and reused)."""
     parser = argparse.ArgumentParser(
         description="URL-to-URL Product Matching Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1318,6 +2283,11 @@ Examples:
         action="store_true",
         help="Open live HTML dashboard in browser"
     )
+    ui_group.add_argument(
+        "--simulate-delay",
+        action="store_true",
+        help="Pace loaded and demo products like a live crawl (for UI demos)"
+    )
 
     # Output & checkpoint
     output_group = parser.add_argument_group("Output")
@@ -1358,6 +2328,16 @@ Examples:
         default="sentence-transformers/all-MiniLM-L6-v2",
         help="Sentence transformer model (default: all-MiniLM-L6-v2)"
     )
+    match_group.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Store Site B embeddings as int8 to cut memory for large catalogs"
+    )
+    match_group.add_argument(
+        "--ann",
+        action="store_true",
+        help="Search Site B with a FAISS HNSW index (top-k) instead of brute force"
+    )
 
     # Performance
     perf_group = parser.add_argument_group("Performance")
@@ -1373,6 +2353,12 @@ Examples:
         default=30,
         help="Requests per minute per site (default: 30)"
     )
+    perf_group.add_argument(
+        "--max-concurrent-sites",
+        type=int,
+        default=4,
+        help="Maximum number of sites crawled at once (default: 4)"
+    )
 
     # Misc
     parser.add_argument(
@@ -1384,10 +2370,15 @@ Examples:
     return parser
 
 
+@lru_cache(maxsize=1)
+def get_args() -> argparse.Namespace:
+    """Parse the command line once; later calls return the same namespace."""
+    return create_parser().parse_args()
+
+
 def main():
     """Main entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    args = get_args()
 
     # Handle --products shorthand
     products_a = args.products_a
@@ -1411,11 +2402,15 @@ def main():
         match_only=args.match_only,
         interactive=args.interactive and not args.no_interactive,
         dashboard=args.dashboard,
+        simulate_delay=args.simulate_delay,
         parallel_browsers=args.parallel,
         rate_limit=args.rate_limit,
+        max_concurrent_sites=args.max_concurrent_sites,
         top_k=args.top_k,
         threshold=args.threshold,
         model=args.model,
+        quantize_embeddings=args.quantize,
+        ann_index=args.ann,
         resume_from=args.resume
     )
 
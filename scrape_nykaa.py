@@ -13,15 +13,17 @@ import csv
 import os
 import random
 import sys
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright, Route, TimeoutError as PlaywrightTimeout
 from tqdm import tqdm
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Data class for product information."""
     url: str
@@ -50,11 +52,72 @@ CATEGORIES = {
     }
 }
 
-
-async def random_delay(min_sec: float = 1.0, max_sec: float = 2.0) -> None:
-    """Add random delay to avoid rate limiting."""
-    delay = random.uniform(min_sec, max_sec)
-    await asyncio.sleep(delay)
+# Product card selectors, as Nykaa's structure may vary, joined into one CSS
+# union so a single wait matches whichever is present
+PRODUCT_SELECTOR = ", ".join([
+    ".css-d5z3ro",  # Common product card class
+    ".product-listing-content",
+    "[data-test-id='product-card']",
+    ".css-1rd7vky",  # Alternative product card class
+    ".css-1knrt9j",  # Another variant
+    ".productWrapper",
+    ".css-po5vsk",  # Product container
+    'a[href*="/p/"]',  # Fallback: any product link
+])
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket shared by every concurrent scrape of one site.
+
+    Holds up to `capacity` tokens refilled at `rate` per second, and each
+    navigation takes one, so parallel contexts together stay under the
+    site's request rate. Waits get random jitter so requests don't line up.
+    """
+
+    def __init__(self, capacity: int, rate: float, jitter: float = 0.5):
+        self.capacity = capacity
+        self.rate = rate
+        self.jitter = jitter
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, n: int = 1) -> None:
+        """Wait until n tokens are available and take them."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                await asyncio.sleep((n - self.tokens) / self.rate + random.uniform(0, self.jitter))
+
+    def penalize(self) -> None:
+        """Back off after a rate-limited or blocked response."""
+        self._refill()
+        self.tokens -= self.rate
+
+
+# Requests aborted in every context: the scraper only reads text, but
+# stylesheets stay so scroll-triggered lazy loading still lays out
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "facebook.com",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+# Shared by all category contexts: bursts of 3, then one request every 2s
+NYKAA_BUCKET = TokenBucket(capacity=3, rate=0.5)
 
 
 async def scroll_page(page: Page, scroll_count: int = 3) -> None:
@@ -70,30 +133,7 @@ async def extract_products_from_page(page: Page, category_name: str, max_product
 
     # Wait for product cards to load
     try:
-        # Try multiple selectors as Nykaa's structure may vary
-        selectors = [
-            ".css-d5z3ro",  # Common product card class
-            ".product-listing-content",
-            "[data-test-id='product-card']",
-            ".css-1rd7vky",  # Alternative product card class
-            ".css-1knrt9j",  # Another variant
-            ".productWrapper",
-            ".css-po5vsk",  # Product container
-        ]
-
-        product_selector = None
-        for selector in selectors:
-            try:
-                await page.wait_for_selector(selector, timeout=5000)
-                product_selector = selector
-                break
-            except PlaywrightTimeout:
-                continue
-
-        if not product_selector:
-            # Fallback: try to find any product links
-            product_selector = 'a[href*="/p/"]'
-            await page.wait_for_selector(product_selector, timeout=10000)
+        await page.wait_for_selector(PRODUCT_SELECTOR, timeout=10000)
 
         # Scroll to load more products
         await scroll_page(page, scroll_count=5)
@@ -102,17 +142,18 @@ async def extract_products_from_page(page: Page, category_name: str, max_product
         product_data = await page.evaluate("""
             () => {
                 const products = [];
+                const seen = new Set();
+                const PRICE_RE = /Rs\\.?\\s*([\\d,]+)|₹\\s*([\\d,]+)/i;
+                const CARD_SELECTOR = '.css-d5z3ro, .css-1rd7vky, .css-1knrt9j, [class*="product"], [class*="Product"], li, article';
 
-                // Try to find product containers
-                const productCards = document.querySelectorAll('[class*="product"], [class*="Product"], .css-d5z3ro, .css-1rd7vky, .css-1knrt9j');
+                // One pass over product links; each link's card is its
+                // nearest product-like ancestor
+                for (const link of document.querySelectorAll('a[href*="/p/"]')) {
+                    const url = link.href;
+                    if (!url || seen.has(url)) continue;
 
-                for (const card of productCards) {
                     try {
-                        // Find product link
-                        const link = card.querySelector('a[href*="/p/"]');
-                        if (!link) continue;
-
-                        const url = link.href;
+                        const card = link.closest(CARD_SELECTOR) || link.parentElement || link;
 
                         // Find title - try multiple approaches
                         let title = '';
@@ -122,57 +163,33 @@ async def extract_products_from_page(page: Page, category_name: str, max_product
                         } else if (link.title) {
                             title = link.title;
                         } else {
-                            // Try to get title from nested text
-                            const textNodes = card.querySelectorAll('span, p, div');
-                            for (const node of textNodes) {
-                                const text = node.textContent.trim();
-                                if (text.length > 10 && text.length < 200 && !text.includes('Rs.') && !text.includes('OFF')) {
-                                    title = text;
-                                    break;
-                                }
-                            }
+                            const text = link.textContent.trim();
+                            if (text.length > 5) title = text;
                         }
+                        if (!title) continue;
 
                         // Find brand
-                        let brand = '';
                         const brandEl = card.querySelector('[class*="brand"], [class*="Brand"]');
-                        if (brandEl) {
-                            brand = brandEl.textContent.trim();
-                        }
+                        const brand = brandEl ? brandEl.textContent.trim() : '';
 
                         // Find price
                         let price = '';
                         const priceEl = card.querySelector('[class*="price"], [class*="Price"]');
                         if (priceEl) {
                             const priceText = priceEl.textContent.trim();
-                            const priceMatch = priceText.match(/Rs\\.?\\s*([\\d,]+)/i) || priceText.match(/₹\\s*([\\d,]+)/);
-                            if (priceMatch) {
-                                price = 'Rs. ' + priceMatch[1];
-                            } else {
-                                price = priceText;
-                            }
+                            const priceMatch = PRICE_RE.exec(priceText);
+                            price = priceMatch ? 'Rs. ' + (priceMatch[1] || priceMatch[2]) : priceText;
                         }
 
-                        if (url && title) {
-                            products.push({ url, title, brand, price });
-                        }
+                        products.push({ url, title, brand, price });
+                        // Recorded only once extracted: a later anchor for the
+                        // same product (e.g. the name after an image link) may have the title
+                        seen.add(url);
                     } catch (e) {
                         continue;
                     }
                 }
 
-                // Also try finding products via direct link search
-                if (products.length === 0) {
-                    const links = document.querySelectorAll('a[href*="/p/"]');
-                    for (const link of links) {
-                        const url = link.href;
-                        const title = link.textContent.trim() || link.title || '';
-                        if (url && title && title.length > 5) {
-                            products.push({ url, title, brand: '', price: '' });
-                        }
-                    }
-                }
-
                 return products;
             }
         """)
@@ -221,6 +238,7 @@ async def get_next_page_url(page: Page) -> Optional[str]:
                 # If it's a button, click it and return the new URL
                 is_disabled = await next_btn.get_attribute('disabled')
                 if not is_disabled:
+                    await NYKAA_BUCKET.acquire()
                     await next_btn.click()
                     await page.wait_for_load_state('networkidle', timeout=10000)
                     return page.url
@@ -245,15 +263,156 @@ async def get_next_page_url(page: Page) -> Optional[str]:
     return None
 
 
+class BrowserPool:
+    """
+    One lazily launched Chromium shared by every scrape on the event loop.
+
+    Each scrape takes fresh contexts from acquire_context() and closes only
+    those, so the browser launch is paid once per event loop instead of
+    once per scrape_nykaa call. close() shuts the browser down.
+    """
+
+    def __init__(self):
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire_context(self, **kwargs) -> BrowserContext:
+        """Return a new context, launching the browser on first use."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                # Launch browser with stealth settings
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--disable-blink-features=AutomationControlled',
+                        '--no-sandbox',
+                        '--disable-setuid-sandbox',
+                        '--disable-dev-shm-usage',
+                    ]
+                )
+        return await self._browser.new_context(**kwargs)
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright, if they were started."""
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+BROWSER_POOL = BrowserPool()
+
+
+def is_blocked_host(url: str) -> bool:
+    """True if the URL's host is, or is a subdomain of, a BLOCKED_HOSTS entry."""
+    hostname = urlsplit(url).hostname or ""
+    return any(hostname == host or hostname.endswith("." + host) for host in BLOCKED_HOSTS)
+
+
+async def block_heavy_requests(route: Route) -> None:
+    """Abort image, media, font and analytics requests; continue the rest."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def new_stealth_context() -> BrowserContext:
+    """Create a pooled browser context with realistic settings and stealth scripts."""
+    context = await BROWSER_POOL.acquire_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+        locale='en-IN',
+        timezone_id='Asia/Kolkata',
+        java_script_enabled=True,
+        geolocation={"latitude": 19.0760, "longitude": 72.8777},  # Mumbai
+        permissions=["geolocation"],
+    )
+    await context.route("**/*", block_heavy_requests)
+
+    # Set extra HTTP headers to appear more like a real browser
+    await context.set_extra_http_headers({
+        "Accept-Language": "en-IN,en-US;q=0.9,en;q=0.8,hi;q=0.7",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Cache-Control": "max-age=0",
+    })
+
+    # Add stealth scripts
+    await context.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+
+        // Override chrome detection
+        window.chrome = {
+            runtime: {}
+        };
+
+        // Override permissions
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+                Promise.resolve({ state: Notification.permission }) :
+                originalQuery(parameters)
+        );
+
+        // Override plugins
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5]
+        });
+
+        // Override languages
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-IN', 'en-US', 'en']
+        });
+    """)
+
+    return context
+
+
+async def establish_session(page: Page, category_name: str) -> None:
+    """Visit the homepage first to establish cookies and session."""
+    print(f"Visiting homepage to establish session for {category_name}...")
+    try:
+        await NYKAA_BUCKET.acquire()
+        await page.goto("https://www.nykaa.com", wait_until="domcontentloaded", timeout=30000)
+        await asyncio.sleep(3)  # Let page fully initialize
+        # Simulate human-like behavior
+        await page.mouse.move(500, 300)
+        await asyncio.sleep(0.5)
+        await page.mouse.move(800, 400)
+        await asyncio.sleep(1)
+    except Exception as e:
+        print(f"Warning: Homepage visit failed: {e}")
+
+
 async def scrape_category(
-    page: Page,
+    context: BrowserContext,
     category_key: str,
     target_count: int,
     pbar: tqdm
 ) -> list[Product]:
-    """Scrape products from a single category."""
+    """Scrape products from a single category in its own browser context."""
     category = CATEGORIES[category_key]
     products = []
+
+    page = await context.new_page()
+    await establish_session(page, category['name'])
+
     current_url = category['url']
     page_num = 1
     max_pages = 10  # Safety limit
@@ -263,16 +422,23 @@ async def scrape_category(
             pbar.set_description(f"Scraping {category['name']} (page {page_num})")
 
             # Navigate to search page
-            await page.goto(current_url, wait_until='domcontentloaded', timeout=60000)
-
-            # Wait for dynamic content to load (critical for SPAs)
-            await asyncio.sleep(5)
-            await random_delay(1.5, 2.5)
-
-            # Try to wait for product selector
+            await NYKAA_BUCKET.acquire()
+            response = await page.goto(current_url, wait_until='domcontentloaded', timeout=60000)
+            if response and response.status in (403, 429):
+                NYKAA_BUCKET.penalize()
+
+            # Wait for dynamic content to load (critical for SPAs), moving on
+            # as soon as product links appear or the network goes idle
+            waits = {
+                asyncio.create_task(page.wait_for_selector('a[href*="/p/"]', timeout=15000)),
+                asyncio.create_task(page.wait_for_load_state('networkidle', timeout=15000)),
+            }
             try:
-                await page.wait_for_selector('a[href*="/p/"]', timeout=10000)
-            except PlaywrightTimeout:
+                done, _ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in waits:
+                    task.cancel()
+            if all(task.exception() is not None for task in done):
                 pbar.write(f"Warning: No product links found on {category['name']} page {page_num}")
 
             # Extract products from current page
@@ -297,7 +463,6 @@ async def scrape_category(
 
             current_url = next_url
             page_num += 1
-            await random_delay()
 
         except PlaywrightTimeout:
             print(f"\nTimeout on page {page_num} of {category['name']}")
@@ -327,101 +492,41 @@ async def scrape_nykaa(total_count: int, output_path: str) -> list[Product]:
     print(f"Distribution: {', '.join(f'{CATEGORIES[k]['name']}: {v}' for k, v in category_counts.items())}")
     print("-" * 50)
 
-    async with async_playwright() as p:
-        # Launch browser with stealth settings
-        browser: Browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-            ]
-        )
-
-        # Create context with realistic settings
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            locale='en-IN',
-            timezone_id='Asia/Kolkata',
-            java_script_enabled=True,
-            geolocation={"latitude": 19.0760, "longitude": 72.8777},  # Mumbai
-            permissions=["geolocation"],
-        )
-
-        # Set extra HTTP headers to appear more like a real browser
-        await context.set_extra_http_headers({
-            "Accept-Language": "en-IN,en-US;q=0.9,en;q=0.8,hi;q=0.7",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        })
-
-        # Add stealth scripts
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-
-            // Override chrome detection
-            window.chrome = {
-                runtime: {}
-            };
-
-            // Override permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-
-            // Override plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-
-            // Override languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-IN', 'en-US', 'en']
-            });
-        """)
-
-        page = await context.new_page()
+    # One context per category, so categories are scraped concurrently
+    # with isolated cookies and sessions in the pooled Chromium
+    active_counts = [(key, count) for key, count in category_counts.items() if count > 0]
+    contexts: list[BrowserContext] = []
 
-        # First visit homepage to establish cookies and session
-        print("Visiting homepage to establish session...")
-        try:
-            await page.goto("https://www.nykaa.com", wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)  # Let page fully initialize
-            # Simulate human-like behavior
-            await page.mouse.move(500, 300)
-            await asyncio.sleep(0.5)
-            await page.mouse.move(800, 400)
-            await asyncio.sleep(1)
-        except Exception as e:
-            print(f"Warning: Homepage visit failed: {e}")
+    try:
+        for _ in active_counts:
+            contexts.append(await new_stealth_context())
 
-        # Create progress bar
+        # Create progress bar; if one category fails, the task group cancels
+        # the others before their contexts are closed below
         with tqdm(total=total_count, desc="Scraping", unit="product") as pbar:
-            for category_key, count in category_counts.items():
-                if count > 0:
-                    products = await scrape_category(page, category_key, count, pbar)
-                    all_products.extend(products)
-                    await random_delay(2, 4)  # Longer delay between categories
-
-        await browser.close()
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(scrape_category(context, category_key, count, pbar))
+                    for context, (category_key, count) in zip(contexts, active_counts)
+                ]
+    finally:
+        for context in contexts:
+            await context.close()
+
+    for task in tasks:
+        all_products.extend(task.result())
 
     return all_products
 
 
+async def run_scraper(total_count: int, output_path: str) -> list[Product]:
+    """Run scrape_nykaa and shut down the pooled browser afterwards."""
+    try:
+        return await scrape_nykaa(total_count, output_path)
+    finally:
+        await BROWSER_POOL.close()
+
+
 def save_to_csv(products: list[Product], output_path: str) -> None:
     """Save products to CSV file."""
     # Ensure output directory exists
@@ -432,11 +537,9 @@ def save_to_csv(products: list[Product], output_path: str) -> None:
     # Write CSV
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         if products:
-            fieldnames = ['url', 'title', 'brand', 'category', 'price']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for product in products:
-                writer.writerow(asdict(product))
+            writer = csv.writer(f)
+            writer.writerow(['url', 'title', 'brand', 'category', 'price'])
+            writer.writerows((p.url, p.title, p.brand, p.category, p.price) for p in products)
 
     print(f"\nSaved {len(products)} products to {output_path}")
 
@@ -476,7 +579,7 @@ Examples:
 
     try:
         # Run the async scraper
-        products = asyncio.run(scrape_nykaa(args.count, args.out))
+        products = asyncio.run(run_scraper(args.count, args.out))
 
         if products:
             save_to_csv(products, args.out)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the pipeline runner
+Validates demo-data crawling without network access or existing data
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import run_pipeline
+from run_pipeline import PipelineConfig, PipelineRunner
+
+
+def _collect_demo_products(target: int, simulate_delay: bool) -> tuple:
+    """Generate demo products; return (products, limiter acquisitions, seconds)."""
+    acquisitions = 0
+    original_acquire = run_pipeline.RateLimiter.acquire
+
+    async def counting_acquire(limiter):
+        nonlocal acquisitions
+        acquisitions += 1
+        await original_acquire(limiter)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = PipelineConfig(
+            site_a="demo-test-site",
+            output_dir=Path(tmp) / "output",
+            checkpoint_dir=Path(tmp) / "checkpoints",
+            simulate_delay=simulate_delay
+        )
+        runner = PipelineRunner(config)
+
+        async def collect():
+            return [p async for p in runner._iter_products("demo-test-site", target)]
+
+        run_pipeline.RateLimiter.acquire = counting_acquire
+        try:
+            start = time.monotonic()
+            products = asyncio.run(collect())
+            elapsed = time.monotonic() - start
+        finally:
+            run_pipeline.RateLimiter.acquire = original_acquire
+
+    return products, acquisitions, elapsed
+
+
+def test_demo_crawl_skips_fetch_limits():
+    """Test that demo data is generated without rate-limiter waits by default."""
+    print("Testing demo crawl with default settings...")
+
+    # 2000 products is 100 demo "pages", far beyond the 30/min burst
+    products, acquisitions, elapsed = _collect_demo_products(2000, simulate_delay=False)
+    assert len(products) == 2000
+    assert acquisitions == 0, f"{acquisitions} limiter acquisitions"
+    assert elapsed < 5.0, f"took {elapsed:.1f}s"
+    print(f"  ✓ 2000 demo products in {elapsed:.2f}s with no limiter waits")
+
+
+def test_demo_crawl_paced_with_simulate_delay():
+    """Test that simulate_delay routes demo pages through the fetch limits."""
+    print("Testing demo crawl with simulate_delay...")
+
+    products, acquisitions, _ = _collect_demo_products(60, simulate_delay=True)
+    assert len(products) == 60
+    assert acquisitions == 3, f"{acquisitions} limiter acquisitions"  # One per page of 20
+    print("  ✓ One limiter token per demo page")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    print("="*60)
+    print("PIPELINE RUNNER - UNIT TESTS")
+    print("="*60)
+    print()
+
+    try:
+        test_demo_crawl_skips_fetch_limits()
+        test_demo_crawl_paced_with_simulate_delay()
+
+        print("="*60)
+        print("ALL TESTS PASSED!")
+        print("="*60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        return 1
+    except Exception as e:
+        print(f"\n✗ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())